@@ -12,8 +12,11 @@ Key Design:
 - Parses variant patterns to match specific mutations (e.g., G719S matches G719.)
 - Returns structured CGIBiomarker objects with approval status
 - Complements FDA label search which uses generic text (e.g., "non-resistant mutations")
+- fetch_biomarkers_async downloads with the shared async httpx client so CGI
+  can run in asyncio.gather alongside the other sources
 """
 
+import asyncio
 import csv
 import re
 from datetime import datetime, timedelta
@@ -22,6 +25,7 @@ from typing import Any
 
 import httpx
 
+from tumorboard.api.http_client import create_async_client
 from tumorboard.constants import TUMOR_TYPE_MAPPINGS
 
 
@@ -102,6 +106,26 @@ class CGIClient:
         """
         self.timeout = timeout
         self._biomarkers: list[dict[str, str]] | None = None
+        self._client: httpx.AsyncClient | None = None
+        # Serializes the first async load so concurrent callers share one download
+        self._load_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "CGIClient":
+        """Async context manager entry."""
+        self._client = create_async_client(self.timeout)
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the async HTTP client, creating it if needed."""
+        if self._client is None:
+            self._client = create_async_client(self.timeout)
+        return self._client
 
     def _cache_is_valid(self) -> bool:
         """Check if the cached file exists and is recent enough."""
@@ -119,6 +143,19 @@ class CGIClient:
             response.raise_for_status()
             self.CACHE_FILE.write_text(response.text)
 
+    async def _download_biomarkers_async(self) -> None:
+        """Download the biomarkers TSV file without blocking the event loop."""
+        response = await self._get_client().get(self.BIOMARKERS_URL)
+        response.raise_for_status()
+        self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(self.CACHE_FILE.write_text, response.text)
+
+    def _read_cache(self) -> list[dict[str, str]]:
+        """Parse the cached biomarkers TSV file."""
+        with open(self.CACHE_FILE, "r", newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f, delimiter="\t")
+            return list(reader)
+
     def _load_biomarkers(self) -> list[dict[str, str]]:
         """Load and parse the biomarkers TSV file."""
         if not self._cache_is_valid():
@@ -129,9 +166,19 @@ class CGIClient:
                     raise CGIError(f"Failed to download CGI biomarkers: {e}")
                 # Use stale cache if download fails
 
-        with open(self.CACHE_FILE, "r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f, delimiter="\t")
-            return list(reader)
+        return self._read_cache()
+
+    async def _load_biomarkers_async(self) -> list[dict[str, str]]:
+        """Async counterpart of ``_load_biomarkers``; parses in a worker thread."""
+        if not self._cache_is_valid():
+            try:
+                await self._download_biomarkers_async()
+            except Exception as e:
+                if not self.CACHE_FILE.exists():
+                    raise CGIError(f"Failed to download CGI biomarkers: {e}") from e
+                # Use stale cache if download fails
+
+        return await asyncio.to_thread(self._read_cache)
 
     def _get_biomarkers(self) -> list[dict[str, str]]:
         """Get biomarkers, loading from cache if needed."""
@@ -291,6 +338,27 @@ class CGIClient:
 
         return matches
 
+    async def fetch_biomarkers_async(
+        self, gene: str, variant: str, tumor_type: str | None = None
+    ) -> list[CGIBiomarker]:
+        """Async version of ``fetch_biomarkers`` for use in ``asyncio.gather``.
+
+        The first load (download and parse of the TSV) runs under a lock, so
+        concurrent callers wait for it instead of each downloading the file;
+        after that the rows are held in memory and matching is a short scan.
+        """
+        if self._biomarkers is None:
+            async with self._load_lock:
+                if self._biomarkers is None:
+                    self._biomarkers = await self._load_biomarkers_async()
+        return self.fetch_biomarkers(gene, variant, tumor_type)
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
     def fetch_fda_approved(
         self, gene: str, variant: str, tumor_type: str | None = None
     ) -> list[CGIBiomarker]:
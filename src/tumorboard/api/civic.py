@@ -20,6 +20,7 @@ from typing import Any
 
 import httpx
 
+from tumorboard.api.http_client import create_async_client
 from tumorboard.constants import TUMOR_TYPE_MAPPINGS
 
 
@@ -188,7 +189,7 @@ class CIViCClient:
 
     async def __aenter__(self):
         """Initialize HTTP client session."""
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        self._client = create_async_client(self.timeout)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -200,7 +201,7 @@ class CIViCClient:
     def _get_client(self) -> httpx.AsyncClient:
         """Get the HTTP client, creating one if needed."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = create_async_client(self.timeout)
         return self._client
 
     def _tumor_matches(self, civic_disease: str, tumor_type: str | None) -> bool:
@@ -12,6 +12,7 @@ Key Design:
 - Context manager for session cleanup
 """
 import json
+import re
 from typing import Any
 
 import httpx
@@ -22,8 +23,36 @@ from tenacity import (
     wait_exponential,
 )
 
+from tumorboard.api.http_client import create_async_client
 from tumorboard.constants import GENE_ALIASES
 
+# Single amino-acid substitutions like G719S; FDA labels name the codon class as G719X
+_CODON_SUBSTITUTION_RE = re.compile(r'^([A-Z])(\d+)([A-Z])$')
+
+# Context phrases that mean a gene/disease mention is not an approval
+_CONTEXT_EXCLUSION_TERMS = ('no data', 'not studied', 'not recommended', 'not indicated')
+
+# Myeloproliferative neoplasm genes and the diseases their mutations define
+_MPN_GENES = ('MPL', 'JAK2', 'CALR')
+_MPN_DISEASE_PATTERNS = (
+    ('myelofibrosis', 'myelofibrosis'),
+    ('polycythemia vera', 'polycythemia vera'),
+    ('myeloproliferative neoplasm', 'myeloproliferative neoplasms'),
+    ('primary myelofibrosis', 'primary myelofibrosis'),
+    ('post-polycythemia vera', 'post-polycythemia vera myelofibrosis'),
+    ('post-essential thrombocythemia', 'post-essential thrombocythemia myelofibrosis'),
+)
+
+# Mismatch repair genes and the MSI-H/dMMR phrasing used in their approvals
+_MMR_GENES = ('MLH1', 'MSH2', 'MSH6', 'PMS2')
+_MSI_BIOMARKER_PATTERNS = (
+    ('microsatellite instability-high', 'MSI-H (microsatellite instability-high)'),
+    ('microsatellite instability high', 'MSI-H (microsatellite instability-high)'),
+    ('msi-h', 'MSI-H (microsatellite instability-high)'),
+    ('mismatch repair deficient', 'dMMR (mismatch repair deficient)'),
+    ('dmmr', 'dMMR (mismatch repair deficient)'),
+)
+
 
 class FDAAPIError(Exception):
     """Exception raised for FDA API errors."""
@@ -31,6 +60,12 @@ class FDAAPIError(Exception):
     pass
 
 
+class FDARateLimitError(FDAAPIError):
+    """Exception raised when openFDA throttles (429) or is overloaded (503)."""
+
+    pass
+
+
 class FDAClient:
     """Client for FDA openFDA API.
 
@@ -61,7 +96,7 @@ class FDAClient:
 
     async def __aenter__(self) -> "FDAClient":
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        self._client = create_async_client(self.timeout)
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
@@ -73,11 +108,13 @@ class FDAClient:
     def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = create_async_client(self.timeout)
         return self._client
 
     @retry(
-        retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException)),
+        retry=retry_if_exception_type(
+            (httpx.HTTPError, httpx.TimeoutException, FDARateLimitError)
+        ),
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
     )
@@ -120,6 +157,9 @@ class FDAClient:
             if e.response.status_code == 404:
                 # No results found
                 return {"results": []}
+            if e.response.status_code in (429, 503):
+                # Retried with backoff by the decorator above
+                raise FDARateLimitError(f"openFDA rate limit: {e}") from e
             raise FDAAPIError(f"HTTP error: {e}")
 
     async def fetch_drug_approvals(
@@ -161,12 +201,11 @@ class FDAClient:
             if variant_clean:
                 # Build list of search terms: exact variant + codon-level patterns
                 # e.g., for G719S, search for "G719S", "G719X" (FDA often uses X for any amino acid)
-                import re
                 search_variants = [variant_clean]
 
                 # Extract codon position for pattern-based search
                 # Matches patterns like G719S, L858R, V600E, etc.
-                codon_match = re.match(r'^([A-Z])(\d+)([A-Z])$', variant_clean)
+                codon_match = _CODON_SUBSTITUTION_RE.match(variant_clean)
                 if codon_match:
                     # Add codon-level pattern with X (FDA convention for any amino acid)
                     # e.g., "G719X" for G719S - this is how FDA labels often describe variant classes
@@ -306,18 +345,18 @@ class FDAClient:
                 indication_text = " ".join(indications)
             else:
                 indication_text = str(indications)
+            # Lower-cased once; every indication search below runs against it
+            indication_lower = indication_text.lower()
 
             # Check if variant is explicitly mentioned in indications (e.g., T790M for TAGRISSO)
             variant_in_indications = False
             indication_variant_note = None
             if variant:
-                import re
                 variant_upper = variant.upper()
-                indication_upper = indication_text.upper()
+                idx = indication_lower.find(variant_upper.lower())
 
-                if variant_upper in indication_upper:
+                if idx != -1:
                     # Extract the specific indication sentence for this variant
-                    idx = indication_upper.find(variant_upper)
                     # Find the bullet point or sentence containing this variant
                     start = indication_text.rfind("•", 0, idx)
                     if start == -1:
@@ -373,7 +412,6 @@ class FDAClient:
                     'pathogenic brca',
                 ])
 
-            indication_lower = indication_text.lower()
             for pattern in gene_class_approval_patterns:
                 if pattern in indication_lower:
                     # Find context for this gene-class approval
@@ -387,8 +425,8 @@ class FDAClient:
                     context_snippet = indication_text[start:end].strip()
 
                     # Check it's not an exclusion
-                    exclusion_terms = ['no data', 'not studied', 'not recommended', 'not indicated']
-                    is_excluded = any(ex in context_snippet.lower() for ex in exclusion_terms)
+                    context_lower = context_snippet.lower()
+                    is_excluded = any(ex in context_lower for ex in _CONTEXT_EXCLUSION_TERMS)
 
                     if not is_excluded:
                         variant_in_indications = True
@@ -399,16 +437,8 @@ class FDAClient:
             # These mutations are DIAGNOSTIC markers - having them DEFINES the disease.
             # Jakafi (ruxolitinib) is approved for myelofibrosis/PV, which ARE the diseases these mutations cause.
             # The FDA label says "myelofibrosis" not "MPL-mutated" because the mutation IS the disease.
-            if gene_upper in ['MPL', 'JAK2', 'CALR'] and not variant_in_indications:
-                mpn_disease_patterns = [
-                    ('myelofibrosis', 'myelofibrosis'),
-                    ('polycythemia vera', 'polycythemia vera'),
-                    ('myeloproliferative neoplasm', 'myeloproliferative neoplasms'),
-                    ('primary myelofibrosis', 'primary myelofibrosis'),
-                    ('post-polycythemia vera', 'post-polycythemia vera myelofibrosis'),
-                    ('post-essential thrombocythemia', 'post-essential thrombocythemia myelofibrosis'),
-                ]
-                for search_pattern, display_name in mpn_disease_patterns:
+            if gene_upper in _MPN_GENES and not variant_in_indications:
+                for search_pattern, display_name in _MPN_DISEASE_PATTERNS:
                     if search_pattern in indication_lower:
                         # Find context for this disease-based approval
                         idx = indication_lower.find(search_pattern)
@@ -421,8 +451,8 @@ class FDAClient:
                         context_snippet = indication_text[start:end].strip()
 
                         # Check it's not an exclusion
-                        exclusion_terms = ['no data', 'not studied', 'not recommended', 'not indicated']
-                        is_excluded = any(ex in context_snippet.lower() for ex in exclusion_terms)
+                        context_lower = context_snippet.lower()
+                        is_excluded = any(ex in context_lower for ex in _CONTEXT_EXCLUSION_TERMS)
 
                         if not is_excluded:
                             variant_in_indications = True
@@ -434,15 +464,8 @@ class FDAClient:
             # which results in microsatellite instability-high (MSI-H).
             # Pembrolizumab (KEYTRUDA) is FDA-approved tumor-agnostic for MSI-H/dMMR solid tumors.
             # The FDA label says "MSI-H" or "dMMR" - not the specific gene names.
-            if gene_upper in ['MLH1', 'MSH2', 'MSH6', 'PMS2'] and not variant_in_indications:
-                msi_biomarker_patterns = [
-                    ('microsatellite instability-high', 'MSI-H (microsatellite instability-high)'),
-                    ('microsatellite instability high', 'MSI-H (microsatellite instability-high)'),
-                    ('msi-h', 'MSI-H (microsatellite instability-high)'),
-                    ('mismatch repair deficient', 'dMMR (mismatch repair deficient)'),
-                    ('dmmr', 'dMMR (mismatch repair deficient)'),
-                ]
-                for search_pattern, display_name in msi_biomarker_patterns:
+            if gene_upper in _MMR_GENES and not variant_in_indications:
+                for search_pattern, display_name in _MSI_BIOMARKER_PATTERNS:
                     if search_pattern in indication_lower:
                         # Find context for this biomarker-based approval
                         idx = indication_lower.find(search_pattern)
@@ -455,8 +478,8 @@ class FDAClient:
                         context_snippet = indication_text[start:end].strip()
 
                         # Check it's not an exclusion
-                        exclusion_terms = ['no data', 'not studied', 'not recommended', 'not indicated']
-                        is_excluded = any(ex in context_snippet.lower() for ex in exclusion_terms)
+                        context_lower = context_snippet.lower()
+                        is_excluded = any(ex in context_lower for ex in _CONTEXT_EXCLUSION_TERMS)
 
                         if not is_excluded:
                             variant_in_indications = True
@@ -468,7 +491,6 @@ class FDAClient:
             # in clinical studies but not in the generic indications text
             clinical_studies_note = None
             if variant:
-                import re
                 clinical_studies = approval_record.get("clinical_studies", [])
                 if isinstance(clinical_studies, list):
                     clinical_text = " ".join(clinical_studies)
@@ -481,7 +503,7 @@ class FDAClient:
                 # Build search patterns: exact variant + codon-level pattern with wildcard
                 # e.g., for G719S: search for "G719S", "G719X", "G719A", etc.
                 search_patterns = [variant_upper]
-                codon_match = re.match(r'^([A-Z])(\d+)([A-Z])$', variant_upper)
+                codon_match = _CODON_SUBSTITUTION_RE.match(variant_upper)
                 if codon_match:
                     # Add codon pattern with X wildcard (e.g., "G719X" for G719S)
                     codon_pattern = codon_match.group(1) + codon_match.group(2) + "X"
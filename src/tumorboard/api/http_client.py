@@ -0,0 +1,17 @@
+"""Shared httpx setup for the async API clients.
+
+httpx only speaks HTTP/2 when the optional ``h2`` package is installed
+(``pip install tumorboard[http2]``). With it, concurrent requests to the
+same host are multiplexed over one connection instead of each opening its
+own TCP/TLS connection; without it, clients fall back to HTTP/1.1.
+"""
+from importlib.util import find_spec
+
+import httpx
+
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
+def create_async_client(timeout: float) -> httpx.AsyncClient:
+    """Create an AsyncClient that negotiates HTTP/2 when h2 is available."""
+    return httpx.AsyncClient(timeout=timeout, http2=HTTP2_AVAILABLE)
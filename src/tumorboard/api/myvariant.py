@@ -23,6 +23,7 @@ from tenacity import (
     wait_exponential,
 )
 
+from tumorboard.api.http_client import create_async_client
 from tumorboard.api.myvariant_models import MyVariantHit, MyVariantResponse
 
 from tumorboard.models.evidence.civic import  CIViCEvidence
@@ -68,7 +69,7 @@ class MyVariantClient:
 
     async def __aenter__(self) -> "MyVariantClient":
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        self._client = create_async_client(self.timeout)
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
@@ -80,7 +81,7 @@ class MyVariantClient:
     def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = create_async_client(self.timeout)
         return self._client
 
     @retry(
@@ -19,12 +19,30 @@ Key Design:
 - Sources attributed to original KB for provenance tracking
 """
 import json
+import re
+from functools import lru_cache
 from typing import Any
 
 import httpx
 
+from tumorboard.api.http_client import create_async_client
 from tumorboard.constants import TUMOR_TYPE_MAPPINGS
 
+# OncoKB uses levels like 1A, 1B, 2A, 2B, 3A, 3B, 4, R1, R2
+_ONCOKB_LEVEL_RE = re.compile(r'^([1234][AB]?|R[12])$')
+
+
+@lru_cache(maxsize=256)
+def _response_flags(response_type: str) -> tuple[bool, bool]:
+    """Classify a response type as (sensitivity, resistance).
+
+    Responses only use a handful of distinct strings, so each one is
+    upper-cased and scanned once.
+    """
+    rt_upper = response_type.upper()
+    is_sensitivity = any(term in rt_upper for term in ("SENSITIV", "RESPONSE", "RESPONSIVE"))
+    return is_sensitivity, "RESIST" in rt_upper
+
 
 class VICCError(Exception):
     """Exception raised for VICC MetaKB-related errors."""
@@ -67,22 +85,19 @@ class VICCAssociation:
         """Check if this represents a sensitivity/response association."""
         if not self.response_type:
             return False
-        rt_upper = self.response_type.upper()
-        return any(term in rt_upper for term in ["SENSITIV", "RESPONSE", "RESPONSIVE"])
+        return _response_flags(self.response_type)[0]
 
     def is_resistance(self) -> bool:
         """Check if this represents a resistance association."""
         if not self.response_type:
             return False
-        return "RESIST" in self.response_type.upper()
+        return _response_flags(self.response_type)[1]
 
     def get_oncokb_level(self) -> str | None:
         """Extract OncoKB-style level if present (1A, 1B, 2A, 2B, 3A, 3B, 4, R1, R2)."""
         if not self.response_type:
             return None
-        # OncoKB uses levels like 1A, 1B, 2A, 2B, 3A, 3B, 4, R1, R2
-        import re
-        match = re.match(r'^([1234][AB]?|R[12])$', self.response_type.upper())
+        match = _ONCOKB_LEVEL_RE.match(self.response_type.upper())
         if match:
             return match.group(1)
         return None
@@ -131,7 +146,7 @@ class VICCClient:
 
     async def __aenter__(self):
         """Initialize HTTP client session."""
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        self._client = create_async_client(self.timeout)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -143,7 +158,7 @@ class VICCClient:
     def _get_client(self) -> httpx.AsyncClient:
         """Get the HTTP client, creating one if needed."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = create_async_client(self.timeout)
         return self._client
 
     def _get_kit_exon(self, variant: str) -> int | None:
@@ -31,12 +31,9 @@ from tumorboard.api.pubmed import PubMedClient, PubMedArticle, PubMedRateLimitEr
 from tumorboard.api.semantic_scholar import SemanticScholarClient, SemanticScholarRateLimitError
 from tumorboard.llm.service import LLMService
 from tumorboard.models.assessment import ActionabilityAssessment
-from tumorboard.models.evidence.cgi import CGIBiomarkerEvidence
-from tumorboard.models.evidence.civic import CIViCAssertionEvidence
+from tumorboard.models.evidence.builders import populate_all
 from tumorboard.models.evidence.clinical_trials import ClinicalTrialEvidence
-from tumorboard.models.evidence.fda import FDAApproval
 from tumorboard.models.evidence.pubmed import PubMedEvidence
-from tumorboard.models.evidence.vicc import VICCEvidence
 from tumorboard.models.variant import VariantInput
 from tumorboard.utils import normalize_variant
 
@@ -75,6 +72,7 @@ class AssessmentEngine:
         """
         await self.myvariant_client.__aenter__()
         await self.fda_client.__aenter__()
+        await self.cgi_client.__aenter__()
         await self.oncotree_client.__aenter__()
         if self.vicc_client:
             await self.vicc_client.__aenter__()
@@ -92,6 +90,7 @@ class AssessmentEngine:
         """Close HTTP client session to prevent resource leaks."""
         await self.myvariant_client.__aexit__(exc_type, exc_val, exc_tb)
         await self.fda_client.__aexit__(exc_type, exc_val, exc_tb)
+        await self.cgi_client.__aexit__(exc_type, exc_val, exc_tb)
         await self.oncotree_client.__aexit__(exc_type, exc_val, exc_tb)
         if self.vicc_client:
             await self.vicc_client.__aexit__(exc_type, exc_val, exc_tb)
@@ -290,8 +289,7 @@ class AssessmentEngine:
                 gene=variant_input.gene,
                 variant=normalized_variant,
             ),
-            asyncio.to_thread(
-                self.cgi_client.fetch_biomarkers,
+            self.cgi_client.fetch_biomarkers_async(
                 variant_input.gene,
                 normalized_variant,
                 resolved_tumor_type,
@@ -341,79 +339,21 @@ class AssessmentEngine:
         # Unpack literature result (papers/articles, source)
         literature_items, literature_source = literature_raw if isinstance(literature_raw, tuple) else ([], None)
 
-        # Parse FDA approval data and add to evidence
-        if fda_approvals_raw:
-            fda_approvals = []
-            for approval_record in fda_approvals_raw:
-                # Pass variant to extract clinical_studies mentions for variants like G719X
-                parsed = self.fda_client.parse_approval_data(
+        # Convert the FDA, CGI, VICC and CIViC results and attach them to evidence.
+        # FDA records are parsed with the variant so clinical_studies mentions
+        # are extracted for variants like G719X.
+        populate_all(
+            evidence,
+            fda=[
+                self.fda_client.parse_approval_data(
                     approval_record, variant_input.gene, normalized_variant
                 )
-                if parsed:
-                    fda_approvals.append(FDAApproval(**parsed))
-            evidence.fda_approvals = fda_approvals
-
-        # Add CGI biomarkers to evidence
-        if cgi_biomarkers_raw:
-            cgi_evidence = []
-            for biomarker in cgi_biomarkers_raw:
-                cgi_evidence.append(CGIBiomarkerEvidence(
-                    gene=biomarker.gene,
-                    alteration=biomarker.alteration,
-                    drug=biomarker.drug,
-                    drug_status=biomarker.drug_status,
-                    association=biomarker.association,
-                    evidence_level=biomarker.evidence_level,
-                    source=biomarker.source,
-                    tumor_type=biomarker.tumor_type,
-                    fda_approved=biomarker.is_fda_approved(),
-                ))
-            evidence.cgi_biomarkers = cgi_evidence
-
-        # Add VICC MetaKB associations to evidence
-        if vicc_associations_raw:
-            vicc_evidence = []
-            for assoc in vicc_associations_raw:
-                vicc_evidence.append(VICCEvidence(
-                    description=assoc.description,
-                    gene=assoc.gene,
-                    variant=assoc.variant,
-                    disease=assoc.disease,
-                    drugs=assoc.drugs,
-                    evidence_level=assoc.evidence_level,
-                    response_type=assoc.response_type,
-                    source=assoc.source,
-                    publication_url=assoc.publication_url,
-                    oncogenic=assoc.oncogenic,
-                    is_sensitivity=assoc.is_sensitivity(),
-                    is_resistance=assoc.is_resistance(),
-                    oncokb_level=assoc.get_oncokb_level(),
-                ))
-            evidence.vicc = vicc_evidence
-
-        # Add CIViC Assertions to evidence (curated AMP/ASCO/CAP tier classifications)
-        if civic_assertions_raw:
-            civic_assertions_evidence = []
-            for assertion in civic_assertions_raw:
-                civic_assertions_evidence.append(CIViCAssertionEvidence(
-                    assertion_id=assertion.assertion_id,
-                    name=assertion.name,
-                    amp_level=assertion.amp_level,
-                    amp_tier=assertion.get_amp_tier(),
-                    amp_level_letter=assertion.get_amp_level(),
-                    assertion_type=assertion.assertion_type,
-                    significance=assertion.significance,
-                    status=assertion.status,
-                    molecular_profile=assertion.molecular_profile,
-                    disease=assertion.disease,
-                    therapies=assertion.therapies,
-                    fda_companion_test=assertion.fda_companion_test,
-                    nccn_guideline=assertion.nccn_guideline,
-                    description=assertion.description,
-                    is_sensitivity=assertion.is_sensitivity(),
-                    is_resistance=assertion.is_resistance(),
-                ))
-            evidence.civic_assertions = civic_assertions_evidence
+                for approval_record in fda_approvals_raw or ()
+            ],
+            cgi=cgi_biomarkers_raw,
+            vicc=vicc_associations_raw,
+            civic=civic_assertions_raw,
+        )
 
         # Add clinical trials to evidence
         if clinical_trials_raw:
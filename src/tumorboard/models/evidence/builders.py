@@ -0,0 +1,112 @@
+"""Convert API client results into the evidence models held by ``Evidence``."""
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from tumorboard.models.evidence.cgi import CGIBiomarkerEvidence
+from tumorboard.models.evidence.civic import CIViCAssertionEvidence
+from tumorboard.models.evidence.fda import FDAApproval
+from tumorboard.models.evidence.vicc import VICCEvidence
+
+if TYPE_CHECKING:
+    from tumorboard.api.cgi import CGIBiomarker
+    from tumorboard.api.civic import CIViCAssertion
+    from tumorboard.api.vicc import VICCAssociation
+    from tumorboard.models.evidence.evidence import Evidence
+
+
+def build_fda_approvals(parsed_records: Iterable[dict[str, Any] | None]) -> list[FDAApproval]:
+    """Build approvals from ``FDAClient.parse_approval_data`` results, skipping unparseable ones."""
+    return [FDAApproval(**parsed) for parsed in parsed_records if parsed]
+
+
+def build_cgi_evidence(biomarkers: Iterable["CGIBiomarker"]) -> list[CGIBiomarkerEvidence]:
+    """Convert CGI biomarkers to ``CGIBiomarkerEvidence`` models."""
+    return [
+        CGIBiomarkerEvidence(
+            gene=biomarker.gene,
+            alteration=biomarker.alteration,
+            drug=biomarker.drug,
+            drug_status=biomarker.drug_status,
+            association=biomarker.association,
+            evidence_level=biomarker.evidence_level,
+            source=biomarker.source,
+            tumor_type=biomarker.tumor_type,
+            fda_approved=biomarker.is_fda_approved(),
+        )
+        for biomarker in biomarkers
+    ]
+
+
+def build_vicc_evidence(associations: Iterable["VICCAssociation"]) -> list[VICCEvidence]:
+    """Convert VICC MetaKB associations to ``VICCEvidence`` models."""
+    return [
+        VICCEvidence(
+            description=assoc.description,
+            gene=assoc.gene,
+            variant=assoc.variant,
+            disease=assoc.disease,
+            drugs=assoc.drugs,
+            evidence_level=assoc.evidence_level,
+            response_type=assoc.response_type,
+            source=assoc.source,
+            publication_url=assoc.publication_url,
+            oncogenic=assoc.oncogenic,
+            is_sensitivity=assoc.is_sensitivity(),
+            is_resistance=assoc.is_resistance(),
+            oncokb_level=assoc.get_oncokb_level(),
+        )
+        for assoc in associations
+    ]
+
+
+def build_civic_assertion_evidence(
+    assertions: Iterable["CIViCAssertion"],
+) -> list[CIViCAssertionEvidence]:
+    """Convert CIViC assertions to ``CIViCAssertionEvidence`` models."""
+    return [
+        CIViCAssertionEvidence(
+            assertion_id=assertion.assertion_id,
+            name=assertion.name,
+            amp_level=assertion.amp_level,
+            amp_tier=assertion.get_amp_tier(),
+            amp_level_letter=assertion.get_amp_level(),
+            assertion_type=assertion.assertion_type,
+            significance=assertion.significance,
+            status=assertion.status,
+            molecular_profile=assertion.molecular_profile,
+            disease=assertion.disease,
+            therapies=assertion.therapies,
+            fda_companion_test=assertion.fda_companion_test,
+            nccn_guideline=assertion.nccn_guideline,
+            description=assertion.description,
+            is_sensitivity=assertion.is_sensitivity(),
+            is_resistance=assertion.is_resistance(),
+        )
+        for assertion in assertions
+    ]
+
+
+def populate_all(
+    evidence: "Evidence",
+    *,
+    fda: Iterable[dict[str, Any] | None] | None = None,
+    cgi: Iterable["CGIBiomarker"] | None = None,
+    vicc: Iterable["VICCAssociation"] | None = None,
+    civic: Iterable["CIViCAssertion"] | None = None,
+) -> "Evidence":
+    """Attach each non-empty source to ``evidence`` and return it.
+
+    ``fda`` takes parsed approval records; the other sources take the
+    client results as returned. Sources that are None or empty leave the
+    corresponding field untouched.
+    """
+    if fda:
+        evidence.fda_approvals = build_fda_approvals(fda)
+    if cgi:
+        evidence.cgi_biomarkers = build_cgi_evidence(cgi)
+    if vicc:
+        evidence.vicc = build_vicc_evidence(vicc)
+    if civic:
+        evidence.civic_assertions = build_civic_assertion_evidence(civic)
+    return evidence
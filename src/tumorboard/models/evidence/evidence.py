@@ -1,5 +1,8 @@
 """Evidence data models from external databases."""
 
+from collections.abc import Iterator
+from functools import lru_cache
+from itertools import islice
 from typing import Any
 import logging
 
@@ -28,6 +31,34 @@ logger = logging.getLogger(__name__)
 # Load variant class configuration
 _variant_config = load_variant_classes()
 
+# Flattens line breaks and tabs in abstract previews in a single pass
+_WS_TABLE = str.maketrans({'\n': ' ', '\r': ' ', '\t': ' '})
+
+# Fixed fragments reused across summary lines
+_FDA_NOTE = " [FDA Companion Test]"
+_NA = "N/A"
+
+
+@lru_cache(maxsize=4096)
+def _tumor_disease_match(tumor_type: str, disease: str) -> bool:
+    """Cached core of Evidence._tumor_matches.
+
+    Tier hints test the same few disease strings against one tumor type many
+    times per variant, and a miss scans every TUMOR_TYPE_MAPPINGS entry.
+    """
+    tumor_lower = tumor_type.lower().strip()
+    disease_lower = disease.lower().strip()
+
+    if tumor_lower in disease_lower or disease_lower in tumor_lower:
+        return True
+
+    for abbrev, full_names in TUMOR_TYPE_MAPPINGS.items():
+        if tumor_lower == abbrev or any(tumor_lower in name for name in full_names):
+            if any(name in disease_lower for name in full_names):
+                return True
+
+    return False
+
 
 
 
@@ -64,19 +95,7 @@ class Evidence(VariantAnnotations):
         """Check if tumor type matches disease using flexible matching."""
         if not tumor_type or not disease:
             return False
-
-        tumor_lower = tumor_type.lower().strip()
-        disease_lower = disease.lower().strip()
-
-        if tumor_lower in disease_lower or disease_lower in tumor_lower:
-            return True
-
-        for abbrev, full_names in TUMOR_TYPE_MAPPINGS.items():
-            if tumor_lower == abbrev or any(tumor_lower in name for name in full_names):
-                if any(name in disease_lower for name in full_names):
-                    return True
-
-        return False
+        return _tumor_disease_match(tumor_type, disease)
 
     def _variant_matches_approval_class(self, gene: str, variant: str,
                                        indication_text: str, approval: FDAApproval,
@@ -125,7 +144,7 @@ class Evidence(VariantAnnotations):
             if not parsed['tumor_match']:
                 continue
 
-            indication_lower = (approval.indication or '').lower()
+            indication_lower = approval.indication_lower
             gene_lower = self.gene.lower()
 
             wildtype_patterns = [
@@ -260,8 +279,12 @@ class Evidence(VariantAnnotations):
             return ""
 
         lines = []
-        resistance_articles = [a for a in self.pubmed_articles if a.is_resistance_evidence()]
-        other_articles = [a for a in self.pubmed_articles if not a.is_resistance_evidence()]
+        resistance_articles, other_articles = [], []
+        for a in self.pubmed_articles:
+            if a.is_resistance_evidence():
+                resistance_articles.append(a)
+            else:
+                other_articles.append(a)
 
         if resistance_articles:
             lines.append(f"PUBMED LITERATURE - RESISTANCE EVIDENCE ({len(resistance_articles)} articles):")
@@ -272,7 +295,7 @@ class Evidence(VariantAnnotations):
                 lines.append(f"      {article.format_citation()}")
                 if article.abstract:
                     # Show first 200 chars of abstract
-                    abstract_preview = article.abstract[:200].replace('\n', ' ')
+                    abstract_preview = article.abstract[:200].translate(_WS_TABLE)
                     lines.append(f"      Abstract: {abstract_preview}...")
             lines.append("")
 
@@ -329,7 +352,7 @@ class Evidence(VariantAnnotations):
             if not parsed['tumor_match']:
                 continue
 
-            indication_lower = (approval.indication or '').lower()
+            indication_lower = approval.indication_lower
             variant_lower = self.variant.lower()
 
             # Strategy 1: Explicit variant mention (but check for exclusion context AND special rules)
@@ -1240,7 +1263,7 @@ class Evidence(VariantAnnotations):
         # (e.g., EGFR R108K does NOT match "EGFR mutation" approval - extracellular domain)
         has_fda_elsewhere = False
         for approval in self.fda_approvals:
-            indication_lower = (approval.indication or '').lower()
+            indication_lower = approval.indication_lower
             # Check if variant matches approval criteria (not just gene mention)
             if self._variant_matches_approval_class(
                 self.gene, self.variant, indication_lower, approval, tumor_type=None
@@ -1643,7 +1666,7 @@ class Evidence(VariantAnnotations):
                 parsed = approval.parse_indication_for_tumor(tumor_type)
                 if parsed['tumor_match']:
                     drug = approval.brand_name or approval.generic_name or approval.drug_name
-                    indication_lower = (approval.indication or '').lower()
+                    indication_lower = approval.indication_lower
 
                     # Check if this approval is specifically for the variant being queried
                     # variant_in_indications is authoritative (FDA label explicitly mentions variant)
@@ -1855,11 +1878,17 @@ class Evidence(VariantAnnotations):
 
     def summary_compact(self, tumor_type: str | None = None) -> str:
         """Generate a compact summary - FDA approvals and CGI only."""
-        lines = [f"Evidence for {self.gene} {self.variant}:\n"]
+        parts = list(self._iter_summary_lines(tumor_type))
+        return "\n".join(parts) if len(parts) > 1 else ""
+
+    def _iter_summary_lines(self, tumor_type: str | None = None) -> Iterator[str]:
+        """Yield the lines of the compact summary, starting with the header."""
+        join = ", ".join
+        yield f"Evidence for {self.gene} {self.variant}:\n"
 
         if self.fda_approvals:
-            lines.append(f"FDA Approved Drugs ({len(self.fda_approvals)}):")
-            for approval in self.fda_approvals[:5]:
+            yield f"FDA Approved Drugs ({len(self.fda_approvals)}):"
+            for approval in islice(self.fda_approvals, 5):
                 drug = approval.brand_name or approval.generic_name or approval.drug_name
                 variant_explicit = approval.variant_in_clinical_studies
 
@@ -1872,7 +1901,7 @@ class Evidence(VariantAnnotations):
 
                         # Check if this variant is actually approved for this tumor type
                         # (not just mentioned in clinical studies as resistant/not sensitive)
-                        indication_lower = (approval.indication or '').lower()
+                        indication_lower = approval.indication_lower
                         is_variant_approved = (
                             approval.variant_in_indications or
                             self._variant_matches_approval_class(self.gene, self.variant, indication_lower, approval, tumor_type)
@@ -1886,27 +1915,27 @@ class Evidence(VariantAnnotations):
                             # (e.g., D816V mentioned as resistant in GIST context)
                             variant_note = " [variant mentioned but NOT approved for this tumor type]"
 
-                        lines.append(f"  • {drug} [FOR {tumor_type.upper()}]{variant_note}:")
-                        lines.append(f"      Line of therapy: {line_info}")
-                        lines.append(f"      Approval type: {approval_info}")
+                        yield f"  • {drug} [FOR {tumor_type.upper()}]{variant_note}:"
+                        yield f"      Line of therapy: {line_info}"
+                        yield f"      Approval type: {approval_info}"
 
                         indication = approval.indication or ""
                         if "[Clinical studies mention" in indication:
                             cs_start = indication.find("[Clinical studies mention")
                             cs_excerpt = indication[cs_start:cs_start+400]
-                            lines.append(f"      {cs_excerpt}...")
+                            yield f"      {cs_excerpt}..."
                         else:
-                            lines.append(f"      Excerpt: {parsed['indication_excerpt'][:200]}...")
+                            yield f"      Excerpt: {parsed['indication_excerpt'][:200]}..."
                     else:
                         # FDA approval is for a DIFFERENT tumor type
                         indication = (approval.indication or "")[:300]
-                        lines.append(f"  • {drug} [DIFFERENT TUMOR TYPE - NOT {tumor_type.upper()}]: {indication}...")
+                        yield f"  • {drug} [DIFFERENT TUMOR TYPE - NOT {tumor_type.upper()}]: {indication}..."
                 else:
                     indication = (approval.indication or "")[:300]
                     date_str = f" (Approved: {approval.approval_date})" if approval.approval_date else ""
                     status_str = f" [{approval.marketing_status}]" if approval.marketing_status else ""
-                    lines.append(f"  • {drug}{date_str}{status_str}: {indication}...")
-            lines.append("")
+                    yield f"  • {drug}{date_str}{status_str}: {indication}..."
+            yield ""
 
         if self.cgi_biomarkers:
             approved = [b for b in self.cgi_biomarkers if b.fda_approved]
@@ -1915,72 +1944,77 @@ class Evidence(VariantAnnotations):
                 sensitivity_approved = [b for b in approved if b.association and 'RESIST' not in b.association.upper()]
 
                 if resistance_approved:
-                    lines.append(f"CGI FDA-APPROVED RESISTANCE MARKERS ({len(resistance_approved)}):")
-                    lines.append("  *** THESE VARIANTS EXCLUDE USE OF FDA-APPROVED THERAPIES ***")
-                    for b in resistance_approved[:5]:
-                        lines.append(f"  • {b.drug} [{b.association.upper()}] in {b.tumor_type or 'solid tumors'} - Evidence: {b.evidence_level}")
-                    lines.append("  → This variant causes RESISTANCE to the above drug(s), making it Tier II actionable as a NEGATIVE biomarker.")
-                    lines.append("")
+                    yield f"CGI FDA-APPROVED RESISTANCE MARKERS ({len(resistance_approved)}):"
+                    yield "  *** THESE VARIANTS EXCLUDE USE OF FDA-APPROVED THERAPIES ***"
+                    for b in islice(resistance_approved, 5):
+                        yield f"  • {b.drug} [{b.association.upper()}] in {b.tumor_type or 'solid tumors'} - Evidence: {b.evidence_level}"
+                    yield "  → This variant causes RESISTANCE to the above drug(s), making it Tier II actionable as a NEGATIVE biomarker."
+                    yield ""
 
                 if sensitivity_approved:
-                    lines.append(f"CGI FDA-Approved Sensitivity Biomarkers ({len(sensitivity_approved)}):")
-                    for b in sensitivity_approved[:5]:
-                        lines.append(f"  • {b.drug} [{b.association}] in {b.tumor_type or 'solid tumors'} - Evidence: {b.evidence_level}")
-                    lines.append("")
+                    yield f"CGI FDA-Approved Sensitivity Biomarkers ({len(sensitivity_approved)}):"
+                    for b in islice(sensitivity_approved, 5):
+                        yield f"  • {b.drug} [{b.association}] in {b.tumor_type or 'solid tumors'} - Evidence: {b.evidence_level}"
+                    yield ""
 
         if self.civic_assertions:
-            predictive_tier_i = [a for a in self.civic_assertions
-                                  if a.amp_tier == "Tier I" and a.assertion_type == "PREDICTIVE"]
-            predictive_tier_ii = [a for a in self.civic_assertions
-                                   if a.amp_tier == "Tier II" and a.assertion_type == "PREDICTIVE"]
-            prognostic = [a for a in self.civic_assertions if a.assertion_type == "PROGNOSTIC"]
+            # Bucket assertions in a single pass
+            predictive_tier_i, predictive_tier_ii, prognostic = [], [], []
+            for a in self.civic_assertions:
+                assertion_type = a.assertion_type
+                if assertion_type == "PREDICTIVE":
+                    if a.amp_tier == "Tier I":
+                        predictive_tier_i.append(a)
+                    elif a.amp_tier == "Tier II":
+                        predictive_tier_ii.append(a)
+                elif assertion_type == "PROGNOSTIC":
+                    prognostic.append(a)
 
             if predictive_tier_i:
-                lines.append(f"CIViC PREDICTIVE TIER I ASSERTIONS ({len(predictive_tier_i)}):")
-                lines.append("  *** EXPERT-CURATED - THERAPY ACTIONABLE ***")
-                for a in predictive_tier_i[:5]:
-                    therapies = ", ".join(a.therapies) if a.therapies else "N/A"
-                    fda_note = " [FDA Companion Test]" if a.fda_companion_test else ""
+                yield f"CIViC PREDICTIVE TIER I ASSERTIONS ({len(predictive_tier_i)}):"
+                yield "  *** EXPERT-CURATED - THERAPY ACTIONABLE ***"
+                for a in islice(predictive_tier_i, 5):
+                    therapies = join(a.therapies) if a.therapies else _NA
+                    fda_note = _FDA_NOTE if a.fda_companion_test else ""
                     nccn_note = f" [NCCN: {a.nccn_guideline}]" if a.nccn_guideline else ""
-                    lines.append(f"  • {a.molecular_profile}: {therapies} [{a.significance}]{fda_note}{nccn_note}")
-                    lines.append(f"      AMP Level: {a.amp_level}, Disease: {a.disease}")
-                lines.append("")
+                    yield f"  • {a.molecular_profile}: {therapies} [{a.significance}]{fda_note}{nccn_note}"
+                    yield f"      AMP Level: {a.amp_level}, Disease: {a.disease}"
+                yield ""
 
             if predictive_tier_ii:
-                lines.append(f"CIViC Predictive Tier II Assertions ({len(predictive_tier_ii)}):")
-                for a in predictive_tier_ii[:3]:
-                    therapies = ", ".join(a.therapies) if a.therapies else "N/A"
-                    lines.append(f"  • {a.molecular_profile}: {therapies} [{a.significance}]")
-                lines.append("")
+                yield f"CIViC Predictive Tier II Assertions ({len(predictive_tier_ii)}):"
+                for a in islice(predictive_tier_ii, 3):
+                    therapies = join(a.therapies) if a.therapies else _NA
+                    yield f"  • {a.molecular_profile}: {therapies} [{a.significance}]"
+                yield ""
 
             if prognostic:
-                lines.append(f"CIViC PROGNOSTIC Assertions ({len(prognostic)}):")
-                lines.append("  *** PROGNOSTIC ONLY - indicates outcome, NOT therapy actionability ***")
-                for a in prognostic[:3]:
-                    lines.append(f"  • {a.molecular_profile}: {a.significance} in {a.disease}")
+                yield f"CIViC PROGNOSTIC Assertions ({len(prognostic)}):"
+                yield "  *** PROGNOSTIC ONLY - indicates outcome, NOT therapy actionability ***"
+                for a in islice(prognostic, 3):
+                    yield f"  • {a.molecular_profile}: {a.significance} in {a.disease}"
                     if a.amp_tier:
-                        lines.append(f"      (Prognostic {a.amp_tier} - does NOT imply Tier I/II for therapy)")
-                lines.append("")
+                        yield f"      (Prognostic {a.amp_tier} - does NOT imply Tier I/II for therapy)"
+                yield ""
 
         if self.clinvar:
             sig = self.clinvar[0].clinical_significance if self.clinvar else None
             if sig:
-                lines.append(f"ClinVar: {sig}")
-                lines.append("")
+                yield f"ClinVar: {sig}"
+                yield ""
 
         # Add PubMed literature evidence
         if self.pubmed_articles:
-            resistance_articles = [a for a in self.pubmed_articles if a.is_resistance_evidence()]
+            resistance_articles = [a for a in self.pubmed_articles
+                                   if a.is_resistance_evidence()]
             if resistance_articles:
-                lines.append(f"PUBMED RESISTANCE LITERATURE ({len(resistance_articles)} articles):")
-                lines.append("  *** PEER-REVIEWED EVIDENCE FOR RESISTANCE ***")
-                for article in resistance_articles[:3]:
-                    drugs_str = f" [Drugs: {', '.join(article.drugs_mentioned[:3])}]" if article.drugs_mentioned else ""
-                    lines.append(f"  • PMID {article.pmid}: {article.title[:100]}...{drugs_str}")
-                    lines.append(f"      {article.format_citation()}")
+                yield f"PUBMED RESISTANCE LITERATURE ({len(resistance_articles)} articles):"
+                yield "  *** PEER-REVIEWED EVIDENCE FOR RESISTANCE ***"
+                for article in islice(resistance_articles, 3):
+                    drugs_str = f" [Drugs: {', '.join(islice(article.drugs_mentioned, 3))}]" if article.drugs_mentioned else ""
+                    yield f"  • PMID {article.pmid}: {article.title[:100]}...{drugs_str}"
+                    yield f"      {article.format_citation()}"
                     if article.abstract:
-                        abstract_preview = article.abstract[:250].replace('\n', ' ')
-                        lines.append(f"      Abstract: {abstract_preview}...")
-                lines.append("")
-
-        return "\n".join(lines) if len(lines) > 1 else ""
\ No newline at end of file
+                        abstract_preview = article.abstract[:250].translate(_WS_TABLE)
+                        yield f"      Abstract: {abstract_preview}..."
+                yield ""
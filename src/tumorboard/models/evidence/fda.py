@@ -1,8 +1,177 @@
-from pydantic import BaseModel, Field
+import re
+import sys
+from functools import lru_cache
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# Tumor type -> FDA label keywords (flexible matching)
+_TUMOR_KEYWORDS: dict[str, tuple[str, ...]] = {
+    'colorectal': ('colorectal', 'colon', 'rectal', 'crc', 'mcrc'),
+    'melanoma': ('melanoma',),
+    'lung': ('lung', 'nsclc', 'non-small cell'),
+    'breast': ('breast',),
+    'thyroid': ('thyroid', 'atc', 'anaplastic thyroid'),
+    'gist': ('gist', 'gastrointestinal stromal tumor', 'gastrointestinal stromal'),
+    'gastrointestinal stromal tumor': ('gist', 'gastrointestinal stromal tumor', 'gastrointestinal stromal'),
+    'bladder': ('bladder', 'urothelial', 'transitional cell'),
+    'bladder cancer': ('bladder', 'urothelial', 'transitional cell', 'urothelial carcinoma'),
+    'urothelial': ('urothelial', 'bladder', 'transitional cell'),
+    'cholangiocarcinoma': ('cholangiocarcinoma', 'bile duct', 'biliary'),
+    # Myeloproliferative neoplasms - these are DEFINED by MPL/JAK2/CALR mutations
+    # The FDA labels say "myelofibrosis" or "polycythemia vera" but patients present
+    # with a diagnosis of "myeloproliferative neoplasm" containing these mutations
+    'myeloproliferative neoplasm': ('myelofibrosis', 'polycythemia vera', 'myeloproliferative', 'mpn'),
+    'myeloproliferative': ('myelofibrosis', 'polycythemia vera', 'myeloproliferative', 'mpn'),
+    'mpn': ('myelofibrosis', 'polycythemia vera', 'myeloproliferative', 'mpn'),
+    'myelofibrosis': ('myelofibrosis', 'myeloproliferative'),
+    'polycythemia vera': ('polycythemia vera', 'myeloproliferative'),
+}
+
+
+def _scan_tumor_groups(tumor_lower: str) -> tuple[tuple[str, ...], ...]:
+    """Return every keyword group with a keyword contained in tumor_lower, in order."""
+    return tuple(
+        keywords for keywords in _TUMOR_KEYWORDS.values()
+        if any(kw in tumor_lower for kw in keywords)
+    )
+
+
+# Canonical surface forms (e.g. 'melanoma', 'nsclc') resolve with a single dict
+# hit; anything else falls back to the substring scan.
+_EXACT_TUMOR_MAP: dict[str, tuple[tuple[str, ...], ...]] = {
+    kw: _scan_tumor_groups(kw)
+    for keywords in _TUMOR_KEYWORDS.values()
+    for kw in keywords
+}
+_EXACT_TUMOR_MAP.update({key: _scan_tumor_groups(key) for key in _TUMOR_KEYWORDS})
+
+
+def _tumor_keyword_groups(tumor_lower: str) -> tuple[tuple[str, ...], ...]:
+    """Keyword groups matching a lowercased tumor type."""
+    groups = _EXACT_TUMOR_MAP.get(tumor_lower)
+    if groups is None:
+        groups = _scan_tumor_groups(tumor_lower)
+    return groups
+
+
+# MSI-H/dMMR approval markers; order matters for the excerpt fallback
+_MSI_H_PATTERNS = (
+    'fda approved for msi-h',
+    'fda approved for dmmr',
+    'microsatellite instability-high',
+    'mismatch repair deficient',
+)
+
+# MSI-H/dMMR phrasing with no specific tumor site ("MSI-H solid tumors", "MSI-H Cancer")
+_TUMOR_AGNOSTIC_PHRASES = (
+    'msi-h or dmmr cancer',
+    'msi-h cancer',
+    'dmmr cancer',
+    'msi-h solid tumor',
+    'dmmr solid tumor',
+    'msi-h or mismatch repair deficient cancer',
+    'microsatellite instability-high or mismatch repair deficient cancer',
+)
+
+# Markers that start the next indication section in multi-indication labels
+_NEXT_SECTION_MARKERS = (
+    'non-small cell lung cancer',
+    'nsclc)',
+    'melanoma •',
+    'breast cancer',
+    'thyroid cancer',
+    'limitations of use',
+    '1.1 braf',
+    '1.2 braf',
+    '1.3 braf',
+    '1.4 ',
+)
+
+_LATER_LINE_PHRASES = (
+    'after prior therapy',
+    'after progression',
+    'following progression',
+    'following recurrence',
+    'has progressed',  # "whose disease has progressed on or after"
+    'progressed on or after',
+    'second-line',
+    'second line',
+    'third-line',
+    'third line',
+    'previously treated',
+    'refractory',
+    'who have failed',
+    'after failure',
+    'following prior',
+    'disease progression',
+)
+
+_FIRST_LINE_PHRASES = (
+    'first-line',
+    'first line',
+    'frontline',
+    'initial treatment',
+    'treatment-naive',
+    'previously untreated',
+)
+
+_ACCELERATED_PHRASES = (
+    'accelerated approval',
+    'approved under accelerated',
+    'contingent upon verification',
+    'confirmatory trial',
+)
+
+
+def _compile_phrases(phrases: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile a phrase catalog into a single literal alternation."""
+    return re.compile('|'.join(map(re.escape, phrases)))
+
+
+_MSI_H_RE = _compile_phrases(_MSI_H_PATTERNS)
+_TUMOR_AGNOSTIC_RE = _compile_phrases(_TUMOR_AGNOSTIC_PHRASES)
+_NEXT_SECTION_RE = _compile_phrases(_NEXT_SECTION_MARKERS)
+_LATER_LINE_RE = _compile_phrases(_LATER_LINE_PHRASES)
+_FIRST_LINE_RE = _compile_phrases(_FIRST_LINE_PHRASES)
+_ACCELERATED_RE = _compile_phrases(_ACCELERATED_PHRASES)
+
+# Union of the line-of-therapy and approval-type catalogs. One scan finds the
+# earliest phrase of any kind; sections without one are classified right away,
+# and the per-catalog searches start from that offset instead of the beginning.
+_THERAPY_CONTEXT_RE = _compile_phrases(
+    _LATER_LINE_PHRASES + _FIRST_LINE_PHRASES + _ACCELERATED_PHRASES
+)
+
+
+def _classify_therapy_context(matched_lower: str) -> tuple[str, str]:
+    """Return (line_of_therapy, approval_type) for a lowercased indication section."""
+    first_hit = _THERAPY_CONTEXT_RE.search(matched_lower)
+    if first_hit is None:
+        return 'unspecified', 'full'
+
+    pos = first_hit.start()
+    if _LATER_LINE_RE.search(matched_lower, pos):
+        line_of_therapy = 'later-line'
+    elif _FIRST_LINE_RE.search(matched_lower, pos):
+        line_of_therapy = 'first-line'
+    else:
+        line_of_therapy = 'unspecified'
+
+    approval_type = 'accelerated' if _ACCELERATED_RE.search(matched_lower, pos) else 'full'
+    return line_of_therapy, approval_type
+
+
+@lru_cache(maxsize=4096)
+def _lower_indication(indication: str) -> str:
+    """Lowercase an FDA label; keyed on the text so copies never see a stale value."""
+    return indication.lower()
+
 
 class FDAApproval(BaseModel):
     """FDA drug approval information."""
 
+    model_config = ConfigDict(frozen=True)
+
     drug_name: str | None = None
     brand_name: str | None = None
     generic_name: str | None = None
@@ -13,6 +182,11 @@ class FDAApproval(BaseModel):
     variant_in_indications: bool = False
     variant_in_clinical_studies: bool = False
 
+    @property
+    def indication_lower(self) -> str:
+        """Lowercased indication text, computed once per distinct label."""
+        return _lower_indication(self.indication or '')
+
     def parse_indication_for_tumor(self, tumor_type: str) -> dict:
         """Parse FDA indication text to extract line-of-therapy and approval type for a specific tumor."""
         if not self.indication or not tumor_type:
@@ -23,209 +197,105 @@ class FDAApproval(BaseModel):
                 'indication_excerpt': ''
             }
 
-        indication_lower = self.indication.lower()
-        tumor_lower = tumor_type.lower()
-
-        # Check for tumor type match (flexible matching)
-        tumor_keywords = {
-            'colorectal': ['colorectal', 'colon', 'rectal', 'crc', 'mcrc'],
-            'melanoma': ['melanoma'],
-            'lung': ['lung', 'nsclc', 'non-small cell'],
-            'breast': ['breast'],
-            'thyroid': ['thyroid', 'atc', 'anaplastic thyroid'],
-            'gist': ['gist', 'gastrointestinal stromal tumor', 'gastrointestinal stromal'],
-            'gastrointestinal stromal tumor': ['gist', 'gastrointestinal stromal tumor', 'gastrointestinal stromal'],
-            'bladder': ['bladder', 'urothelial', 'transitional cell'],
-            'bladder cancer': ['bladder', 'urothelial', 'transitional cell', 'urothelial carcinoma'],
-            'urothelial': ['urothelial', 'bladder', 'transitional cell'],
-            'cholangiocarcinoma': ['cholangiocarcinoma', 'bile duct', 'biliary'],
-            # Myeloproliferative neoplasms - these are DEFINED by MPL/JAK2/CALR mutations
-            # The FDA labels say "myelofibrosis" or "polycythemia vera" but patients present
-            # with a diagnosis of "myeloproliferative neoplasm" containing these mutations
-            'myeloproliferative neoplasm': ['myelofibrosis', 'polycythemia vera', 'myeloproliferative', 'mpn'],
-            'myeloproliferative': ['myelofibrosis', 'polycythemia vera', 'myeloproliferative', 'mpn'],
-            'mpn': ['myelofibrosis', 'polycythemia vera', 'myeloproliferative', 'mpn'],
-            'myelofibrosis': ['myelofibrosis', 'myeloproliferative'],
-            'polycythemia vera': ['polycythemia vera', 'myeloproliferative'],
+        tumor_match, line_of_therapy, approval_type, excerpt = _parse_indication_for_tumor(
+            self.indication, self.indication_lower, sys.intern(tumor_type)
+        )
+        return {
+            'tumor_match': tumor_match,
+            'line_of_therapy': line_of_therapy,
+            'approval_type': approval_type,
+            'indication_excerpt': excerpt
         }
 
-        tumor_match = False
-        matched_section = ""
-
-        # Priority 0: Detect TUMOR-AGNOSTIC MSI-H/dMMR approvals
-        # These apply to ANY solid tumor (endometrial, pancreatic, ovarian, etc.)
-        # FDA label says "MSI-H or dMMR solid tumors" or "MSI-H or dMMR Cancer"
-        # The [FDA APPROVED FOR MSI-H...] prefix indicates this is a tumor-agnostic approval
-        msi_h_tumor_agnostic_patterns = [
-            'fda approved for msi-h',
-            'fda approved for dmmr',
-            'microsatellite instability-high',
-            'mismatch repair deficient',
-        ]
-        is_msi_h_approval = any(p in indication_lower for p in msi_h_tumor_agnostic_patterns)
-
-        # For MSI-H/dMMR approvals, check if approval is tumor-agnostic (applies to all solid tumors)
-        # vs tumor-specific (e.g., "MSI-H colorectal cancer" only applies to CRC)
-        if is_msi_h_approval:
-            # Check if this is a tumor-agnostic approval (no specific tumor mentioned with MSI-H)
-            # Look for phrases like "MSI-H solid tumors" or "MSI-H Cancer" without a specific site
-            tumor_agnostic_phrases = [
-                'msi-h or dmmr cancer',
-                'msi-h cancer',
-                'dmmr cancer',
-                'msi-h solid tumor',
-                'dmmr solid tumor',
-                'msi-h or mismatch repair deficient cancer',
-                'microsatellite instability-high or mismatch repair deficient cancer',
-            ]
-            is_tumor_agnostic = any(p in indication_lower for p in tumor_agnostic_phrases)
-
-            if is_tumor_agnostic:
-                # This is a tumor-agnostic approval - applies to ANY solid tumor
-                # Including endometrial, pancreatic, ovarian, gastric, etc.
-                # Extract the MSI-H section as the matched section
-                for pattern in ['[fda approved for msi-h', '[fda approved for dmmr']:
-                    if pattern in indication_lower:
-                        idx = indication_lower.find(pattern)
-                        bracket_end = self.indication.find(']', idx)
-                        if bracket_end > 0:
-                            matched_section = self.indication[idx:bracket_end + 1]
-                            tumor_match = True
-                            break
-
-                if not tumor_match:
-                    # Fallback: find MSI-H mention in indication
-                    for pattern in msi_h_tumor_agnostic_patterns:
-                        if pattern in indication_lower:
-                            idx = indication_lower.find(pattern)
-                            start = max(0, idx - 50)
-                            end = min(len(self.indication), idx + 300)
-                            matched_section = self.indication[start:end]
-                            tumor_match = True
-                            break
-
-        # Priority 1: If indication has a variant-specific section at the start (from fda.py),
-        # use that section for line-of-therapy detection. This handles cases like TAGRISSO
-        # where T790M has its own later-line indication separate from L858R/exon19del first-line.
-        if not tumor_match and self.indication.startswith('[FDA APPROVED FOR'):
-            # Extract the variant-specific section
-            bracket_end = self.indication.find(']')
-            if bracket_end > 0:
-                variant_section = self.indication[:bracket_end + 1]
-                # Check if this variant section mentions the tumor type
-                variant_section_lower = variant_section.lower()
-                for key, keywords in tumor_keywords.items():
-                    if any(kw in tumor_lower for kw in keywords):
-                        if any(kw in variant_section_lower for kw in keywords):
-                            tumor_match = True
-                            matched_section = variant_section
-                            break
-                if not tumor_match and tumor_lower in variant_section_lower:
+
+@lru_cache(maxsize=4096)
+def _parse_indication_for_tumor(
+    indication: str, indication_lower: str, tumor_type: str
+) -> tuple[bool, str, str, str]:
+    """Cached core of FDAApproval.parse_indication_for_tumor.
+
+    Keyed on the raw strings so identical labels shared across approvals and
+    variants are only parsed once per tumor type. The lowered label is passed in
+    so callers scoring one approval against several tumors lower it only once.
+    Returns a hashable (tumor_match, line_of_therapy, approval_type,
+    indication_excerpt) tuple.
+    """
+    # All searches run on ind_low and the resulting offsets are reused to
+    # slice ind (brackets/keywords are ASCII).
+    ind = indication
+    ind_low = indication_lower
+    ind_len = len(ind)
+    tumor_lower = tumor_type.lower()
+    tumor_groups = _tumor_keyword_groups(tumor_lower)
+
+    tumor_match = False
+    start = end = 0
+
+    # Priority 0: Detect TUMOR-AGNOSTIC MSI-H/dMMR approvals
+    # These apply to ANY solid tumor (endometrial, pancreatic, ovarian, etc.)
+    # FDA label says "MSI-H or dMMR solid tumors" or "MSI-H or dMMR Cancer"
+    # The [FDA APPROVED FOR MSI-H...] prefix indicates this is a tumor-agnostic approval
+    # For MSI-H/dMMR approvals, check if approval is tumor-agnostic (applies to all solid tumors)
+    # vs tumor-specific (e.g., "MSI-H colorectal cancer" only applies to CRC)
+    if _MSI_H_RE.search(ind_low) and _TUMOR_AGNOSTIC_RE.search(ind_low):
+        # This is a tumor-agnostic approval - applies to ANY solid tumor
+        # Including endometrial, pancreatic, ovarian, gastric, etc.
+        # Extract the MSI-H section as the matched section
+        for pattern in ('[fda approved for msi-h', '[fda approved for dmmr'):
+            idx = ind_low.find(pattern)
+            if idx >= 0:
+                bracket_end = ind_low.find(']', idx)
+                if bracket_end > 0:
+                    start, end = idx, bracket_end + 1
                     tumor_match = True
-                    matched_section = variant_section
+                    break
 
-        # Priority 2: Standard tumor type matching in full indication
         if not tumor_match:
-            tumor_keys = []
-            for key, keywords in tumor_keywords.items():
-                if any(kw in tumor_lower for kw in keywords):
-                    tumor_keys = keywords
+            # Fallback: find MSI-H mention in indication
+            for pattern in _MSI_H_PATTERNS:
+                idx = ind_low.find(pattern)
+                if idx >= 0:
+                    start = max(0, idx - 50)
+                    end = min(ind_len, idx + 300)
+                    tumor_match = True
                     break
-            if not tumor_keys:
-                tumor_keys = [tumor_lower]
 
-            for kw in tumor_keys:
-                if kw in indication_lower:
+    # Priority 1: If indication has a variant-specific section at the start (from fda.py),
+    # use that section for line-of-therapy detection. This handles cases like TAGRISSO
+    # where T790M has its own later-line indication separate from L858R/exon19del first-line.
+    if not tumor_match and ind_low.startswith('[fda approved for'):
+        # Extract the variant-specific section
+        bracket_end = ind_low.find(']')
+        if bracket_end > 0:
+            # Check if this variant section mentions the tumor type
+            variant_section_lower = ind_low[:bracket_end + 1]
+            for keywords in tumor_groups:
+                if any(kw in variant_section_lower for kw in keywords):
                     tumor_match = True
-                    idx = indication_lower.find(kw)
-                    start = max(0, idx - 50)
-                    next_section_markers = [
-                        'non-small cell lung cancer',
-                        'nsclc)',
-                        'melanoma •',
-                        'breast cancer',
-                        'thyroid cancer',
-                        'limitations of use',
-                        '1.1 braf',
-                        '1.2 braf',
-                        '1.3 braf',
-                        '1.4 ',
-                    ]
-                    end = len(self.indication)
-                    for next_sec in next_section_markers:
-                        next_idx = indication_lower.find(next_sec, idx + len(kw) + 100)
-                        if next_idx > idx and next_idx < end:
-                            end = next_idx
-                    matched_section = self.indication[start:end]
                     break
+            if not tumor_match and tumor_lower in variant_section_lower:
+                tumor_match = True
+            if tumor_match:
+                start, end = 0, bracket_end + 1
 
-        if not tumor_match:
-            return {
-                'tumor_match': False,
-                'line_of_therapy': 'unspecified',
-                'approval_type': 'unspecified',
-                'indication_excerpt': ''
-            }
-
-        later_line_phrases = [
-            'after prior therapy',
-            'after progression',
-            'following progression',
-            'following recurrence',
-            'has progressed',  # "whose disease has progressed on or after"
-            'progressed on or after',
-            'second-line',
-            'second line',
-            'third-line',
-            'third line',
-            'previously treated',
-            'refractory',
-            'who have failed',
-            'after failure',
-            'following prior',
-            'disease progression',
-        ]
-
-        first_line_phrases = [
-            'first-line',
-            'first line',
-            'frontline',
-            'initial treatment',
-            'treatment-naive',
-            'previously untreated',
-        ]
-
-        matched_lower = matched_section.lower()
-        line_of_therapy = 'unspecified'
+    # Priority 2: Standard tumor type matching in full indication
+    if not tumor_match:
+        tumor_keys = tumor_groups[0] if tumor_groups else (tumor_lower,)
 
-        for phrase in later_line_phrases:
-            if phrase in matched_lower:
-                line_of_therapy = 'later-line'
+        for kw in tumor_keys:
+            idx = ind_low.find(kw)
+            if idx >= 0:
+                tumor_match = True
+                start = max(0, idx - 50)
+                # The section ends at the earliest marker past the keyword
+                next_sec = _NEXT_SECTION_RE.search(ind_low, idx + len(kw) + 100)
+                end = next_sec.start() if next_sec else ind_len
                 break
 
-        if line_of_therapy == 'unspecified':
-            for phrase in first_line_phrases:
-                if phrase in matched_lower:
-                    line_of_therapy = 'first-line'
-                    break
-
-        approval_type = 'full'
-        accelerated_phrases = [
-            'accelerated approval',
-            'approved under accelerated',
-            'contingent upon verification',
-            'confirmatory trial',
-        ]
-
-        for phrase in accelerated_phrases:
-            if phrase in matched_lower:
-                approval_type = 'accelerated'
-                break
+    if not tumor_match:
+        return False, 'unspecified', 'unspecified', ''
 
-        return {
-            'tumor_match': True,
-            'line_of_therapy': line_of_therapy,
-            'approval_type': approval_type,
-            'indication_excerpt': matched_section[:300]
-        }
+    line_of_therapy, approval_type = _classify_therapy_context(ind_low[start:end])
 
+    # Slice the bounded excerpt directly rather than copying the section first
+    return True, line_of_therapy, approval_type, ind[start:min(end, start + 300)]
@@ -1,10 +1,13 @@
 """Literature-extracted knowledge models."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DrugResistance(BaseModel):
     """Drug resistance information extracted from literature."""
+
+    model_config = ConfigDict(frozen=True)
+
     drug: str = Field(..., description="Drug name")
     evidence: str = Field("unknown", description="Evidence level: in vitro, preclinical, clinical, FDA-labeled")
     mechanism: str | None = Field(None, description="Mechanism of resistance if known")
@@ -13,6 +16,9 @@ class DrugResistance(BaseModel):
 
 class DrugSensitivity(BaseModel):
     """Drug sensitivity information extracted from literature."""
+
+    model_config = ConfigDict(frozen=True)
+
     drug: str = Field(..., description="Drug name")
     evidence: str = Field("unknown", description="Evidence level: in vitro, preclinical, clinical, FDA-labeled")
     ic50_nM: str | None = Field(None, description="IC50 value if reported")
@@ -20,6 +26,9 @@ class DrugSensitivity(BaseModel):
 
 class TierRecommendation(BaseModel):
     """Tier recommendation from literature analysis."""
+
+    model_config = ConfigDict(frozen=True)
+
     tier: str = Field("III", description="Recommended tier: I, II, III, or IV")
     rationale: str = Field("", description="Rationale for tier recommendation")
 
@@ -31,6 +40,8 @@ class LiteratureKnowledge(BaseModel):
     by LLM to extract clinically actionable information.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     mutation_type: str = Field(
         "unknown",
         description="primary (driver), secondary (acquired/resistance), both, or unknown"
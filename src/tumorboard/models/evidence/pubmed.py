@@ -1,6 +1,12 @@
 """PubMed literature evidence models."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+_RESISTANCE_SIGNALS = frozenset(('resistance', 'mixed'))
+_SENSITIVITY_SIGNALS = frozenset(('sensitivity', 'mixed'))
+
+HIGHLY_CITED_THRESHOLD = 50
+INFLUENTIAL_THRESHOLD = 5
 
 
 class PubMedEvidence(BaseModel):
@@ -9,6 +15,8 @@ class PubMedEvidence(BaseModel):
     Enriched with Semantic Scholar metadata when available.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     pmid: str = Field(..., description="PubMed ID")
     title: str = Field(..., description="Article title")
     abstract: str = Field("", description="Article abstract")
@@ -30,11 +38,11 @@ class PubMedEvidence(BaseModel):
 
     def is_resistance_evidence(self) -> bool:
         """Check if this article provides resistance evidence."""
-        return self.signal_type in ['resistance', 'mixed']
+        return self.signal_type in _RESISTANCE_SIGNALS
 
     def is_sensitivity_evidence(self) -> bool:
         """Check if this article provides sensitivity evidence."""
-        return self.signal_type in ['sensitivity', 'mixed']
+        return self.signal_type in _SENSITIVITY_SIGNALS
 
     def get_summary(self, max_length: int = 300) -> str:
         """Get a brief summary of the article."""
@@ -51,11 +59,11 @@ class PubMedEvidence(BaseModel):
         year_str = f"({self.year})" if self.year else ""
         return f"{author_str} {year_str}. {self.journal}. PMID: {self.pmid}"
 
-    def is_highly_cited(self, threshold: int = 50) -> bool:
+    def is_highly_cited(self, threshold: int = HIGHLY_CITED_THRESHOLD) -> bool:
         """Check if article is highly cited."""
         return self.citation_count is not None and self.citation_count >= threshold
 
-    def is_influential(self, threshold: int = 5) -> bool:
+    def is_influential(self, threshold: int = INFLUENTIAL_THRESHOLD) -> bool:
         """Check if article has influential citations."""
         return self.influential_citation_count is not None and self.influential_citation_count >= threshold
 
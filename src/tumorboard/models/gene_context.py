@@ -11,18 +11,30 @@ determines how we interpret variants:
 - TSGs: LOF confirms pathogenicity but usually not directly targetable
 """
 
+import re
+from collections.abc import ItemsView, Iterable, Mapping
 from dataclasses import dataclass
 from enum import Enum
 from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 
+def _freeze(value: Any) -> Any:
+    """Recursively freeze a reference table: dicts -> read-only mappings, lists -> tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 # =============================================================================
 # GENE CLASS CONFIGURATION
 # =============================================================================
 # This replaces gene_classes.yaml - all gene class data is now inline
 
-GENE_CLASS_CONFIG: dict[str, Any] = {
+GENE_CLASS_CONFIG: Mapping[str, Any] = _freeze({
     # DNA Damage Repair (DDR) genes
     # Loss-of-function in these genes creates synthetic lethality with PARP inhibitors
     # and increases sensitivity to platinum-based chemotherapy
@@ -94,21 +106,27 @@ GENE_CLASS_CONFIG: dict[str, Any] = {
             "preclinical_only": "III-C",
         },
     },
-}
+})
 
 
 class GeneClassConfig:
     """Configuration for gene class properties and tier rules."""
 
-    def __init__(self, config: dict[str, Any]):
+    def __init__(self, config: Mapping[str, Any]):
         self._config = config
         self._gene_to_class: dict[str, str] = {}
+        self._gene_to_config: dict[str, Mapping[str, Any]] = {}
 
-        # Build reverse mapping: gene -> class name
+        # Build reverse mapping: gene -> class name (and its config)
         for class_name, class_config in config.items():
-            if isinstance(class_config, dict) and 'genes' in class_config:
+            if isinstance(class_config, Mapping) and 'genes' in class_config:
                 for gene in class_config['genes']:
                     self._gene_to_class[gene.upper()] = class_name
+                    self._gene_to_config[gene.upper()] = class_config
+
+    def _class_config(self, gene: str) -> Mapping[str, Any]:
+        """Get the config of a gene's class, or an empty mapping if unclassified."""
+        return self._gene_to_config.get(gene.upper(), {})
 
     def get_gene_class(self, gene: str) -> str | None:
         """Get the class name for a gene (e.g., 'ddr', 'mmr', 'splicing')."""
@@ -126,20 +144,19 @@ class GeneClassConfig:
         """Check if a gene is a splicing factor gene."""
         return self.get_gene_class(gene) == 'splicing'
 
-    def get_genes_in_class(self, class_name: str) -> list[str]:
+    def get_genes_in_class(self, class_name: str) -> tuple[str, ...]:
         """Get all genes in a specific class."""
         class_config = self._config.get(class_name, {})
-        return class_config.get('genes', [])
+        return class_config.get('genes', ())
 
-    def get_therapeutic_drugs(self, gene: str) -> list[str]:
-        """Get therapeutic drugs/classes for a gene's class."""
-        class_name = self.get_gene_class(gene)
-        if not class_name:
-            return []
+    def gene_class_items(self) -> ItemsView[str, str]:
+        """Get (gene, class name) pairs for every classified gene."""
+        return self._gene_to_class.items()
 
-        class_config = self._config.get(class_name, {})
-        implications = class_config.get('therapeutic_implications', {})
-        return implications.get('drugs', [])
+    def get_therapeutic_drugs(self, gene: str) -> tuple[str, ...]:
+        """Get therapeutic drugs/classes for a gene's class."""
+        implications = self._class_config(gene).get('therapeutic_implications', {})
+        return implications.get('drugs', ())
 
     def get_tier_for_evidence_pattern(self, gene: str, pattern: str) -> str | None:
         """Get the tier recommendation based on evidence pattern.
@@ -151,31 +168,16 @@ class GeneClassConfig:
         Returns:
             Tier string (e.g., 'II-C', 'II-D') or None if not configured
         """
-        class_name = self.get_gene_class(gene)
-        if not class_name:
-            return None
-
-        class_config = self._config.get(class_name, {})
-        tier_rules = class_config.get('tier_rules', {})
+        tier_rules = self._class_config(gene).get('tier_rules', {})
         return tier_rules.get(pattern)
 
     def get_class_description(self, gene: str) -> str | None:
         """Get the description for a gene's class."""
-        class_name = self.get_gene_class(gene)
-        if not class_name:
-            return None
-
-        class_config = self._config.get(class_name, {})
-        return class_config.get('description')
+        return self._class_config(gene).get('description')
 
     def get_therapeutic_mechanism(self, gene: str) -> str | None:
         """Get the therapeutic mechanism explanation for a gene's class."""
-        class_name = self.get_gene_class(gene)
-        if not class_name:
-            return None
-
-        class_config = self._config.get(class_name, {})
-        implications = class_config.get('therapeutic_implications', {})
+        implications = self._class_config(gene).get('therapeutic_implications', {})
         return implications.get('mechanism')
 
 
@@ -214,7 +216,7 @@ class GeneRole(Enum):
 # - In high-prevalence tumors: Tier I-B (FDA-approved or well-powered studies)
 # - In other tumors: Tier II-A (FDA approval in different tumor type)
 
-PATHWAY_ACTIONABLE_TSGS: dict[str, dict] = {
+PATHWAY_ACTIONABLE_TSGS: Mapping[str, Mapping[str, Any]] = _freeze({
     "PTEN": {
         "pathway": "PI3K/AKT/mTOR",
         "mechanism": "PTEN loss → unrestrained PI3K signaling → AKT/mTOR activation",
@@ -257,7 +259,7 @@ PATHWAY_ACTIONABLE_TSGS: dict[str, dict] = {
         "high_prevalence_tumors": ["renal", "kidney", "clear cell renal", "ccRCC", "hemangioblastoma"],
         "fda_context": "Belzutifan FDA-approved for VHL-associated tumors including RCC",
     },
-}
+})
 
 
 # =============================================================================
@@ -276,11 +278,11 @@ PATHWAY_ACTIONABLE_TSGS: dict[str, dict] = {
 # - Class II/III in tumors with FDA approval (NSCLC): Tier I
 # - Class II/III in other tumors with evidence: Tier II
 
-ONCOGENE_MUTATION_CLASSES: dict[str, dict] = {
+ONCOGENE_MUTATION_CLASSES: Mapping[str, Mapping[str, Any]] = _freeze({
     "BRAF": {
         "class_i": {
             "name": "Class I (V600)",
-            "variants": ["V600E", "V600K", "V600D", "V600R", "V600M", "V600G"],
+            "variants": frozenset({"V600E", "V600K", "V600D", "V600R", "V600M", "V600G"}),
             "mechanism": "RAS-independent monomer signaling",
             "drugs": ["vemurafenib", "dabrafenib", "encorafenib"],
             "fda_tumors": ["melanoma", "nsclc", "lung", "colorectal", "thyroid", "hairy cell leukemia"],
@@ -294,7 +296,7 @@ ONCOGENE_MUTATION_CLASSES: dict[str, dict] = {
             "name": "Class II (non-V600 activating)",
             # These variants signal as RAS-independent dimers
             # They are RESISTANT to V600-specific inhibitors but SENSITIVE to MEK inhibitors
-            "variants": [
+            "variants": frozenset({
                 "G469A", "G469V", "G469E", "G469R", "G469S",  # Glycine-rich loop
                 "K601E", "K601N", "K601T",  # Activation loop
                 "L597Q", "L597R", "L597S", "L597V",  # Catalytic loop
@@ -305,7 +307,7 @@ ONCOGENE_MUTATION_CLASSES: dict[str, dict] = {
                 "A598V", "A598T",
                 "T599I", "T599_V600insT",
                 "V600_K601delinsE",
-            ],
+            }),
             "mechanism": "RAS-independent dimer signaling - RESISTANT to V600 inhibitors",
             "drugs": ["trametinib", "binimetinib", "cobimetinib", "selumetinib", "encorafenib + binimetinib"],
             "fda_tumors": ["nsclc", "lung"],  # 2024 FDA approval for encorafenib + binimetinib
@@ -315,10 +317,10 @@ ONCOGENE_MUTATION_CLASSES: dict[str, dict] = {
         "class_iii": {
             "name": "Class III (kinase-impaired)",
             # These have impaired kinase activity but still activate MAPK via RAS
-            "variants": [
+            "variants": frozenset({
                 "D594G", "D594N", "D594E", "D594H", "D594A", "D594V",  # Kinase-dead
                 "G596R", "G596D", "G596C",
-            ],
+            }),
             "mechanism": "Kinase-impaired, RAS-dependent signaling",
             "drugs": ["trametinib", "binimetinib", "cobimetinib"],
             "fda_tumors": ["nsclc", "lung"],
@@ -326,10 +328,37 @@ ONCOGENE_MUTATION_CLASSES: dict[str, dict] = {
             "note": "Only effective in RAS-wildtype tumors; check KRAS/NRAS status",
         },
     },
-}
+})
+
 
+def _build_variant_index() -> dict[tuple[str, str], Mapping[str, Any]]:
+    """Flatten ONCOGENE_MUTATION_CLASSES into (gene, variant) -> finished class info.
 
-def get_oncogene_mutation_class(gene: str, variant: str) -> dict | None:
+    The first class listing a variant wins, matching declaration order.
+    """
+    index: dict[tuple[str, str], Mapping[str, Any]] = {}
+    for gene, gene_classes in ONCOGENE_MUTATION_CLASSES.items():
+        for class_key, class_info in gene_classes.items():
+            for variant in class_info.get("variants", ()):
+                index.setdefault((gene, variant), MappingProxyType({
+                    "gene": gene,
+                    "variant": variant,
+                    "class_key": class_key,
+                    "class_name": class_info["name"],
+                    "mechanism": class_info["mechanism"],
+                    "drugs": class_info["drugs"],
+                    "fda_tumors": class_info.get("fda_tumors", ()),
+                    "fda_context": class_info.get("fda_context"),
+                    "note": class_info.get("note"),
+                    "tumor_specific": class_info.get("tumor_specific", {}),
+                }))
+    return index
+
+
+_VARIANT_INDEX = _build_variant_index()
+
+
+def get_oncogene_mutation_class(gene: str, variant: str) -> Mapping[str, Any] | None:
     """Determine if an oncogene variant belongs to a known mutation class.
 
     Args:
@@ -337,36 +366,48 @@ def get_oncogene_mutation_class(gene: str, variant: str) -> dict | None:
         variant: Variant notation (e.g., V600E, G469A)
 
     Returns:
-        Dict with class info (name, mechanism, drugs, fda_tumors) or None if not classified
+        Read-only mapping with class info (name, mechanism, drugs, fda_tumors)
+        or None if not classified
     """
     gene_upper = gene.upper()
-    variant_upper = variant.upper()
+    # Most genes have no mutation classes; skip normalizing the variant for them
+    if gene_upper not in ONCOGENE_MUTATION_CLASSES:
+        return None
 
     # Strip common prefixes
-    if variant_upper.startswith("P."):
-        variant_upper = variant_upper[2:]
+    return _VARIANT_INDEX.get((gene_upper, variant.upper().removeprefix("P.")))
 
-    gene_classes = ONCOGENE_MUTATION_CLASSES.get(gene_upper)
-    if not gene_classes:
-        return None
 
-    # Check each class
-    for class_key, class_info in gene_classes.items():
-        if variant_upper in class_info.get("variants", []):
-            return {
-                "gene": gene_upper,
-                "variant": variant_upper,
-                "class_key": class_key,
-                "class_name": class_info["name"],
-                "mechanism": class_info["mechanism"],
-                "drugs": class_info["drugs"],
-                "fda_tumors": class_info.get("fda_tumors", []),
-                "fda_context": class_info.get("fda_context"),
-                "note": class_info.get("note"),
-                "tumor_specific": class_info.get("tumor_specific", {}),
-            }
+def _match_tumor_keywords(tumor_lower: str, index: dict[str, frozenset]) -> frozenset:
+    """Collect the owners of every keyword that matches the tumor type.
 
-    return None
+    A keyword matches when either string contains the other, so "renal" matches
+    "clear cell renal cell carcinoma" and "lung" matches the query "lun".
+    """
+    matched: set = set()
+    for keyword, owners in index.items():
+        if keyword in tumor_lower or tumor_lower in keyword:
+            matched.update(owners)
+    return frozenset(matched)
+
+
+def _build_fda_tumor_index() -> dict[str, frozenset[tuple[str, str]]]:
+    """Invert ONCOGENE_MUTATION_CLASSES into fda_tumor keyword -> {(gene, class_key)}."""
+    index: dict[str, set[tuple[str, str]]] = {}
+    for gene, gene_classes in ONCOGENE_MUTATION_CLASSES.items():
+        for class_key, class_info in gene_classes.items():
+            for fda_tumor in class_info.get("fda_tumors", ()):
+                index.setdefault(fda_tumor, set()).add((gene, class_key))
+    return {keyword: frozenset(owners) for keyword, owners in index.items()}
+
+
+_FDA_TUMOR_INDEX = _build_fda_tumor_index()
+
+
+@lru_cache(maxsize=1024)
+def _fda_tumor_classes(tumor_lower: str) -> frozenset[tuple[str, str]]:
+    """Mutation classes, as (gene, class_key), with FDA approval in this tumor type."""
+    return _match_tumor_keywords(tumor_lower, _FDA_TUMOR_INDEX)
 
 
 def is_oncogene_class_fda_tumor(gene: str, variant: str, tumor_type: str | None) -> bool:
@@ -387,15 +428,10 @@ def is_oncogene_class_fda_tumor(gene: str, variant: str, tumor_type: str | None)
     if not class_info:
         return False
 
-    tumor_lower = tumor_type.lower()
-    for fda_tumor in class_info.get("fda_tumors", []):
-        if fda_tumor in tumor_lower or tumor_lower in fda_tumor:
-            return True
+    return (class_info["gene"], class_info["class_key"]) in _fda_tumor_classes(tumor_type.lower())
 
-    return False
 
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GeneContext:
     """Context about a gene from multiple sources."""
     gene: str
@@ -459,7 +495,7 @@ FUSION_GENES = {
 }
 
 
-def get_pathway_actionable_info(gene: str) -> dict | None:
+def get_pathway_actionable_info(gene: str) -> Mapping[str, Any] | None:
     """Get pathway-actionable TSG information if the gene qualifies.
 
     Args:
@@ -471,6 +507,24 @@ def get_pathway_actionable_info(gene: str) -> dict | None:
     return PATHWAY_ACTIONABLE_TSGS.get(gene.upper())
 
 
+def _build_high_prevalence_index() -> dict[str, frozenset[str]]:
+    """Invert PATHWAY_ACTIONABLE_TSGS into high-prevalence tumor keyword -> {genes}."""
+    index: dict[str, set[str]] = {}
+    for gene, info in PATHWAY_ACTIONABLE_TSGS.items():
+        for high_prev_tumor in info.get("high_prevalence_tumors", ()):
+            index.setdefault(high_prev_tumor, set()).add(gene)
+    return {keyword: frozenset(genes) for keyword, genes in index.items()}
+
+
+_HIGH_PREVALENCE_INDEX = _build_high_prevalence_index()
+
+
+@lru_cache(maxsize=1024)
+def _high_prevalence_genes(tumor_lower: str) -> frozenset[str]:
+    """Pathway-actionable TSGs for which this tumor type is high-prevalence."""
+    return _match_tumor_keywords(tumor_lower, _HIGH_PREVALENCE_INDEX)
+
+
 def is_high_prevalence_tumor(gene: str, tumor_type: str | None) -> bool:
     """Check if tumor type is high-prevalence for a pathway-actionable TSG.
 
@@ -484,23 +538,101 @@ def is_high_prevalence_tumor(gene: str, tumor_type: str | None) -> bool:
     if not tumor_type:
         return False
 
-    info = get_pathway_actionable_info(gene)
-    if not info:
-        return False
+    return gene.upper() in _high_prevalence_genes(tumor_type.lower())
+
+
+# gene -> (role, source, has_therapeutic_evidence, therapeutic_summary)
+_RoleEntry = tuple[GeneRole, str, bool, str]
+
+
+def _build_curated_role_map() -> dict[str, _RoleEntry]:
+    """Flatten the hardcoded curated lists into a single gene -> role entry map.
+
+    When a gene is in several lists the earliest wins: DDR, oncogene,
+    pathway-actionable TSG (checked before generic TSGs), then generic TSG.
+    """
+    by_priority: tuple[dict[str, _RoleEntry], ...] = (
+        dict.fromkeys(DDR_GENES, (
+            GeneRole.DDR, "curated_ddr_list", True,
+            "DDR gene - LOF may confer platinum/PARP inhibitor sensitivity",
+        )),
+        dict.fromkeys(ONCOGENES, (
+            GeneRole.ONCOGENE, "curated_oncogene_list", True,
+            "Oncogene - activating mutations may be targetable",
+        )),
+        {
+            gene: (
+                GeneRole.TSG_PATHWAY_ACTIONABLE, "pathway_actionable_tsg", True,
+                f"Pathway-actionable TSG - LOF activates {info['pathway']} pathway. "
+                f"May confer sensitivity to {', '.join(info['drugs'][:3])}. {info.get('fda_context', '')}",
+            )
+            for gene, info in PATHWAY_ACTIONABLE_TSGS.items()
+        },
+        dict.fromkeys(TUMOR_SUPPRESSORS, (
+            GeneRole.TSG, "curated_tsg_list",
+            False,  # TSGs usually not directly targetable
+            "Tumor suppressor - LOF mutations generally not directly targetable",
+        )),
+    )
 
-    tumor_lower = tumor_type.lower()
-    for high_prev_tumor in info.get("high_prevalence_tumors", []):
-        if high_prev_tumor in tumor_lower or tumor_lower in high_prev_tumor:
-            return True
+    role_map: dict[str, _RoleEntry] = {}
+    for entries in reversed(by_priority):
+        role_map.update(entries)
+    return role_map
 
-    return False
+
+def _build_gene_class_role_map() -> dict[str, _RoleEntry]:
+    """Role entries for genes whose YAML class has special handling (DDR, MMR).
+
+    Class membership comes from GeneClassConfig's own gene -> class mapping, so
+    a gene resolves exactly as is_ddr_gene / is_mmr_gene would classify it.
+    """
+    ddr_drugs = GENE_CLASS_CONFIG["ddr"].get("therapeutic_implications", {}).get("drugs", ())
+    ddr_drugs_str = ", ".join(ddr_drugs) if ddr_drugs else "platinum agents, PARP inhibitors"
+    class_entries: dict[str, _RoleEntry] = {
+        "ddr": (
+            GeneRole.DDR, "gene_classes.yaml", True,
+            f"DDR gene - LOF may confer sensitivity to {ddr_drugs_str}",
+        ),
+        "mmr": (
+            GeneRole.DDR,  # MMR is a subtype of DDR
+            "gene_classes.yaml", True,
+            "MMR gene - deficiency causes MSI-H, eligible for checkpoint inhibitors",
+        ),
+    }
+    return {
+        gene: class_entries[class_name]
+        for gene, class_name in load_gene_classes().gene_class_items()
+        if class_name in class_entries
+    }
+
+
+_CURATED_ROLE_MAP = _build_curated_role_map()
+
+# YAML config (user-maintainable) takes precedence over the hardcoded lists
+_GENE_ROLE_MAP: dict[str, _RoleEntry] = {**_CURATED_ROLE_MAP, **_build_gene_class_role_map()}
+
+
+# One shared GeneContext per curated gene (frozen, so safe to hand out)
+_CONTEXT_SINGLETONS: dict[str, GeneContext] = {
+    gene: GeneContext(
+        gene=gene,
+        is_cancer_gene=True,
+        role=role,
+        source=source,
+        has_therapeutic_evidence=has_therapeutic_evidence,
+        therapeutic_summary=therapeutic_summary,
+    )
+    for gene, (role, source, has_therapeutic_evidence, therapeutic_summary) in _GENE_ROLE_MAP.items()
+}
 
 
 def get_gene_context(gene: str) -> GeneContext:
     """Determine gene context from curated lists.
 
     This is fast (no API calls) and provides baseline context.
-    Checks YAML config first (user-maintainable), then falls back to hardcoded lists.
+    YAML config (user-maintainable) takes precedence over the hardcoded lists;
+    the priority is resolved once at import into a single lookup table.
 
     Args:
         gene: Gene symbol (case-insensitive)
@@ -509,82 +641,30 @@ def get_gene_context(gene: str) -> GeneContext:
         GeneContext with role and therapeutic implications
     """
     gene_upper = gene.upper()
+    return _CONTEXT_SINGLETONS.get(gene_upper) or _unknown_gene_context(gene_upper)
 
-    # Try YAML config first (user-maintainable, includes DDR/MMR/splicing)
-    _config = load_gene_classes()
-    if _config.is_ddr_gene(gene_upper):
-        drugs = _config.get_therapeutic_drugs(gene_upper)
-        drugs_str = ", ".join(drugs) if drugs else "platinum agents, PARP inhibitors"
-        return GeneContext(
-            gene=gene_upper,
-            is_cancer_gene=True,
-            role=GeneRole.DDR,
-            source="gene_classes.yaml",
-            has_therapeutic_evidence=True,
-            therapeutic_summary=f"DDR gene - LOF may confer sensitivity to {drugs_str}",
-        )
-
-    if _config.is_mmr_gene(gene_upper):
-        return GeneContext(
-            gene=gene_upper,
-            is_cancer_gene=True,
-            role=GeneRole.DDR,  # MMR is a subtype of DDR
-            source="gene_classes.yaml",
-            has_therapeutic_evidence=True,
-            therapeutic_summary="MMR gene - deficiency causes MSI-H, eligible for checkpoint inhibitors",
-        )
-
-    # Fall back to hardcoded DDR list (may have genes not in YAML)
-    if gene_upper in DDR_GENES:
-        return GeneContext(
-            gene=gene_upper,
-            is_cancer_gene=True,
-            role=GeneRole.DDR,
-            source="curated_ddr_list",
-            has_therapeutic_evidence=True,
-            therapeutic_summary="DDR gene - LOF may confer platinum/PARP inhibitor sensitivity",
-        )
-
-    # Check oncogenes
-    if gene_upper in ONCOGENES:
-        return GeneContext(
-            gene=gene_upper,
-            is_cancer_gene=True,
-            role=GeneRole.ONCOGENE,
-            source="curated_oncogene_list",
-            has_therapeutic_evidence=True,
-            therapeutic_summary="Oncogene - activating mutations may be targetable",
-        )
-
-    # Check pathway-actionable TSGs BEFORE generic TSGs
-    # These are TSGs where LOF activates a druggable downstream pathway
-    pathway_info = get_pathway_actionable_info(gene_upper)
-    if pathway_info:
-        drugs_str = ", ".join(pathway_info["drugs"][:3])
-        return GeneContext(
-            gene=gene_upper,
-            is_cancer_gene=True,
-            role=GeneRole.TSG_PATHWAY_ACTIONABLE,
-            source="pathway_actionable_tsg",
-            has_therapeutic_evidence=True,
-            therapeutic_summary=(
-                f"Pathway-actionable TSG - LOF activates {pathway_info['pathway']} pathway. "
-                f"May confer sensitivity to {drugs_str}. {pathway_info.get('fda_context', '')}"
-            ),
-        )
-
-    # Check generic TSGs (not pathway-actionable)
-    if gene_upper in TUMOR_SUPPRESSORS:
-        return GeneContext(
-            gene=gene_upper,
-            is_cancer_gene=True,
-            role=GeneRole.TSG,
-            source="curated_tsg_list",
-            has_therapeutic_evidence=False,  # TSGs usually not directly targetable
-            therapeutic_summary="Tumor suppressor - LOF mutations generally not directly targetable",
-        )
-
-    # Unknown gene
+
+def get_gene_contexts(genes: Iterable[str]) -> list[GeneContext]:
+    """Determine gene context for many symbols at once (e.g., a cohort variant table).
+
+    Args:
+        genes: Gene symbols (case-insensitive)
+
+    Returns:
+        GeneContext per input symbol, in input order
+    """
+    singletons = _CONTEXT_SINGLETONS
+    return [
+        singletons.get(gene_upper) or _unknown_gene_context(gene_upper)
+        for gene_upper in map(str.upper, genes)
+    ]
+
+
+# Sized to hold every protein-coding symbol (~19k) so whole-exome scans, where
+# most genes are not curated, don't churn the cache
+@lru_cache(maxsize=32768)
+def _unknown_gene_context(gene_upper: str) -> GeneContext:
+    """GeneContext for a symbol not in any curated list."""
     return GeneContext(
         gene=gene_upper,
         is_cancer_gene=False,
@@ -593,6 +673,31 @@ def get_gene_context(gene: str) -> GeneContext:
     )
 
 
+# Notation-based LOF patterns. Each alternative is anchored at the start and
+# uses a lookahead, so they are tried in priority order (a stop codon wins over
+# a frameshift anywhere in the string) rather than by leftmost position.
+_LOF_RE = re.compile(
+    # Truncating variants - high confidence LOF
+    r"(?=.*\*)(?P<stop>)"
+    r"|(?=.*(?:FS|FRAMESHIFT))(?P<frameshift>)"
+    # Large deletion (not just single AA deletion like "K27del")
+    r"|(?=\D*DEL\D*\Z)(?P<deletion>)"
+    # Splice site variants, named or in c./IVS notation
+    r"|(?=.*SPLICE)(?P<splice>)"
+    r"|(?=(?:C\.|IVS).*[+-][12])(?P<splice_notation>)",
+    re.DOTALL,
+)
+
+_LOF_REASONS = {
+    "stop": "nonsense (stop codon)",
+    "frameshift": "frameshift",
+    "deletion": "deletion",
+    "splice": "splice site",
+    "splice_notation": "splice site",
+}
+
+
+@lru_cache(maxsize=8192)
 def is_likely_lof(variant: str) -> tuple[bool, str]:
     """Predict if variant is loss-of-function based on notation.
 
@@ -602,27 +707,10 @@ def is_likely_lof(variant: str) -> tuple[bool, str]:
     Returns:
         Tuple of (is_lof, reason)
     """
-    v = variant.upper()
-
-    # Truncating variants - high confidence LOF
-    if '*' in v:
-        return True, "nonsense (stop codon)"
-    if 'FS' in v or 'FRAMESHIFT' in v:
-        return True, "frameshift"
-    if 'DEL' in v and not any(c.isdigit() for c in v.replace('DEL', '')):
-        # Large deletion (not just single AA deletion like "K27del")
-        return True, "deletion"
-
-    # Splice site variants
-    if 'SPLICE' in v:
-        return True, "splice site"
-
-    # Check for splice notation patterns
-    if v.startswith('C.') or v.startswith('IVS'):
-        if any(p in v for p in ['+1', '+2', '-1', '-2', 'SPLICE']):
-            return True, "splice site"
-
-    return False, ""
+    match = _LOF_RE.match(variant.upper())
+    if match is None:
+        return False, ""
+    return True, _LOF_REASONS[match.lastgroup]
 
 
 def get_therapeutic_implication(gene_context: GeneContext, is_lof: bool) -> str | None:
@@ -673,6 +761,18 @@ def get_therapeutic_implication(gene_context: GeneContext, is_lof: bool) -> str
     return None
 
 
+# SnpEff effects may be combined ("missense_variant&splice_donor_variant"), so
+# truncating terms are matched anywhere in the annotation
+_SNPEFF_TRUNCATING_RE = re.compile(
+    "frameshift|stop_gained|splice_donor|splice_acceptor|start_lost|stop_lost|transcript_ablation"
+)
+# Single-letter PolyPhen-2 codes; full labels are matched by substring
+_POLYPHEN_DAMAGING_CODES = frozenset({"d", "p"})
+_ALPHAMISSENSE_DAMAGING = frozenset({"pathogenic", "p", "likely_pathogenic"})
+_ALPHAMISSENSE_TOLERATED = frozenset({"benign", "b", "likely_benign"})
+
+
+@lru_cache(maxsize=8192)
 def get_lof_assessment(
     variant: str,
     snpeff_effect: str | None = None,
@@ -692,18 +792,15 @@ def get_lof_assessment(
     Returns:
         Tuple of (is_lof, confidence, rationale)
         confidence: "high", "moderate", or "low"
+
+    Results are memoized: the same variant/annotation combination recurs
+    across a cohort and the assessment is pure over its arguments.
     """
     reasons = []
 
     # Check for truncating variants (high confidence LOF)
-    if snpeff_effect:
-        effect_lower = snpeff_effect.lower()
-        truncating_effects = [
-            "frameshift", "stop_gained", "splice_donor", "splice_acceptor",
-            "start_lost", "stop_lost", "transcript_ablation"
-        ]
-        if any(t in effect_lower for t in truncating_effects):
-            return True, "high", f"truncating variant ({snpeff_effect})"
+    if snpeff_effect and _SNPEFF_TRUNCATING_RE.search(snpeff_effect.lower()):
+        return True, "high", f"truncating variant ({snpeff_effect})"
 
     # Check variant notation for truncating patterns
     is_truncating, truncating_reason = is_likely_lof(variant)
@@ -719,7 +816,7 @@ def get_lof_assessment(
     if polyphen2_prediction:
         total_predictions += 1
         pred_lower = polyphen2_prediction.lower()
-        if "damaging" in pred_lower or pred_lower in ["d", "p"]:
+        if "damaging" in pred_lower or pred_lower in _POLYPHEN_DAMAGING_CODES:
             damaging_predictions += 1
             reasons.append(f"PolyPhen2: {polyphen2_prediction}")
         elif "benign" in pred_lower or pred_lower == "b":
@@ -738,10 +835,10 @@ def get_lof_assessment(
     if alphamissense_prediction:
         total_predictions += 1
         pred_lower = alphamissense_prediction.lower()
-        if pred_lower in ["pathogenic", "p", "likely_pathogenic"]:
+        if pred_lower in _ALPHAMISSENSE_DAMAGING:
             damaging_predictions += 1
             reasons.append(f"AlphaMissense: {alphamissense_prediction}")
-        elif pred_lower in ["benign", "b", "likely_benign"]:
+        elif pred_lower in _ALPHAMISSENSE_TOLERATED:
             tolerated_predictions += 1
             tolerated_reasons.append(f"AlphaMissense: {alphamissense_prediction}")
 
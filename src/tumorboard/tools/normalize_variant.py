@@ -26,25 +26,28 @@ Output formats:
 """
 
 import argparse
-import asyncio
 import json
 import re
 import sys
-from typing import Any, TextIO
-
-import httpx
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import nullcontext, suppress
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final, TextIO
 
 from tumorboard.utils.variant_normalization import (
     VariantNormalizer,
-    normalize_variant,
-    to_hgvs_protein,
-    get_protein_position,
-    is_snp_or_small_indel,
+    normalize_variant_full,
 )
 
+# asyncio, httpx and tenacity are imported where --lookup needs them, so plain
+# normalization runs don't pay their import time
+if TYPE_CHECKING:
+    import httpx
+
 
 # Gene to chromosome mapping for common cancer genes
-GENE_CHROMOSOMES = {
+GENE_CHROMOSOMES: Final[Mapping[str, str]] = MappingProxyType({
     "BRAF": "7",
     "KRAS": "12",
     "NRAS": "1",
@@ -117,16 +120,149 @@ GENE_CHROMOSOMES = {
     "CDK6": "7",
     "MDM2": "12",
     "TERT": "5",
-}
+})
+
+
+@lru_cache(maxsize=1024)
+def _chromosome_for(gene: str) -> str | None:
+    """Chromosome for a gene symbol in any case, or None if not mapped."""
+    return GENE_CHROMOSOMES.get(gene.upper())
+
+
+MYVARIANT_QUERY_URL = "https://myvariant.info/v1/query"
+
+# MyVariant.info hit _id for an SNV, e.g. "chr7:g.140453136A>T"
+_ID_RE = re.compile(r"chr(\w+):g\.(\d+)([ACGT])>([ACGT])")
+
+# Maximum concurrent MyVariant.info requests during a batch --lookup run
+LOOKUP_CONCURRENCY = 20
+
+# Maximum lookups kept in _LOOKUP_CACHE; the least recently used go first
+LOOKUP_CACHE_SIZE = 4096
+
+# Lookups that found a hit, by (GENE, variant); batch files repeat common
+# variants. Kept in least- to most-recently-used order.
+_LOOKUP_CACHE: dict[tuple[str, str], dict[str, Any]] = {}
+
+
+# Genomic lookup fields copied into normalize_single() results, in output order
+_GENOMIC_FIELDS = (
+    'hgvs_genomic', 'gene_name', 'gene_id', 'transcript_id', 'exon',
+    'genomic_position', 'ref_allele', 'alt_allele',
+)
+
+
+def create_lookup_client() -> "httpx.AsyncClient":
+    """Create an HTTP client to share across genomic lookups.
+
+    Connections are pooled and kept alive, and concurrent lookups are
+    multiplexed over HTTP/2 when httpx[http2] is installed.
+    """
+    import httpx
+
+    from tumorboard.api.http_client import HTTP2_AVAILABLE
+
+    return httpx.AsyncClient(
+        # No pool timeout: the batch semaphore already bounds waiting requests
+        timeout=httpx.Timeout(10.0, connect=5.0, pool=None),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        http2=HTTP2_AVAILABLE,
+    )
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry transport failures, rate limiting (429) and server errors (5xx)."""
+    import httpx
+
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.TransportError)
 
 
-async def lookup_genomic_info(gene: str, variant: str) -> dict[str, Any]:
+async def _query_myvariant(client: "httpx.AsyncClient", query: str) -> dict[str, Any]:
+    """Fetch the top MyVariant.info hit for a free-text query, with retries."""
+    from tenacity import (
+        AsyncRetrying,
+        retry_if_exception,
+        stop_after_attempt,
+        wait_exponential,
+        wait_random,
+    )
+
+    async for attempt in AsyncRetrying(
+        retry=retry_if_exception(_is_retryable),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.2, max=2) + wait_random(0, 0.1),
+        reraise=True,
+    ):
+        with attempt:
+            response = await client.get(
+                MYVARIANT_QUERY_URL,
+                params={"q": query, "size": 1}
+            )
+            response.raise_for_status()
+            return response.json()
+
+
+def _apply_hit(result: dict[str, Any], hit: dict[str, Any]) -> None:
+    """Copy genomic fields from a MyVariant.info hit into a lookup result."""
+    # Genomic notation from _id (e.g., "chr7:g.140453136A>T")
+    variant_id = hit.get("_id")
+    if variant_id:
+        result["hgvs_genomic"] = variant_id
+        match = _ID_RE.match(variant_id)
+        if match:
+            chrom, position, ref, alt = match.groups()
+            result["chromosome"] = chrom
+            result["genomic_position"] = int(position)
+            result["ref_allele"] = ref
+            result["alt_allele"] = alt
+
+    # CADD gene info, with the chromosome as a fallback
+    cadd = hit.get("cadd")
+    if cadd:
+        gene_info = cadd.get("gene")
+        if gene_info:
+            result["gene_name"] = gene_info.get("genename")
+            result["gene_id"] = gene_info.get("gene_id")
+            result["transcript_id"] = gene_info.get("feature_id")
+        result["exon"] = cadd.get("exon")
+        if not result["chromosome"]:
+            result["chromosome"] = str(cadd.get("chrom", ""))
+
+    # dbSNP gene ID when CADD had none
+    if not result["gene_id"]:
+        dbsnp_gene = (hit.get("dbsnp") or {}).get("gene")
+        if dbsnp_gene:
+            result["gene_id"] = str(dbsnp_gene.get("geneid", ""))
+
+
+async def lookup_genomic_info(
+    gene: str,
+    variant: str,
+    client: "httpx.AsyncClient | None" = None,
+) -> dict[str, Any]:
     """Look up genomic information from MyVariant.info API.
 
     Returns chromosome, genomic notation (g.), transcript info, and gene details.
+    Pass a client from create_lookup_client() to reuse connections across calls;
+    without one, a client is created for this lookup only. Transient failures
+    are retried with backoff; if every attempt fails, the result carries only
+    the local chromosome mapping. Lookups that find a hit are cached, up to
+    LOOKUP_CACHE_SIZE of them; failed or empty ones are tried again on the
+    next call.
     """
+    cache_key = (gene.upper(), variant)
+    cached = _LOOKUP_CACHE.pop(cache_key, None)
+    if cached is not None:
+        # Reinsert so the entry becomes the most recently used
+        _LOOKUP_CACHE[cache_key] = cached
+        return dict(cached)
+
     result = {
-        "chromosome": None,
+        # Chromosome from local mapping first; the API hit may refine it
+        "chromosome": _chromosome_for(gene),
         "hgvs_genomic": None,
         "gene_id": None,
         "gene_name": None,
@@ -137,106 +273,68 @@ async def lookup_genomic_info(gene: str, variant: str) -> dict[str, Any]:
         "genomic_position": None,
     }
 
-    # Add chromosome from local mapping first
-    gene_upper = gene.upper()
-    if gene_upper in GENE_CHROMOSOMES:
-        result["chromosome"] = GENE_CHROMOSOMES[gene_upper]
-
     # Query MyVariant.info API
-    protein_notation = f"p.{variant}" if not variant.lower().startswith("p.") else variant
+    protein_notation = f"p.{variant}" if variant[:2].lower() != "p." else variant
     query = f"{gene} {protein_notation}"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                "https://myvariant.info/v1/query",
-                params={"q": query, "size": 1}
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            if data.get("hits"):
-                hit = data["hits"][0]
-
-                # Extract genomic notation from _id (e.g., "chr7:g.140453136A>T")
-                variant_id = hit.get("_id", "")
-                if variant_id:
-                    result["hgvs_genomic"] = variant_id
-
-                    # Parse chromosome and position from _id
-                    match = re.match(r"chr(\w+):g\.(\d+)([ACGT])>([ACGT])", variant_id)
-                    if match:
-                        result["chromosome"] = match.group(1)
-                        result["genomic_position"] = int(match.group(2))
-                        result["ref_allele"] = match.group(3)
-                        result["alt_allele"] = match.group(4)
-
-                # Extract CADD gene info
-                cadd = hit.get("cadd", {})
-                if cadd:
-                    gene_info = cadd.get("gene", {})
-                    if gene_info:
-                        result["gene_name"] = gene_info.get("genename")
-                        result["gene_id"] = gene_info.get("gene_id")
-                        result["transcript_id"] = gene_info.get("feature_id")
-                    result["exon"] = cadd.get("exon")
-
-                    # Fallback for chromosome
-                    if not result["chromosome"]:
-                        result["chromosome"] = str(cadd.get("chrom", ""))
-
-                # Try dbSNP for gene info
-                dbsnp = hit.get("dbsnp", {})
-                if dbsnp and not result["gene_id"]:
-                    dbsnp_gene = dbsnp.get("gene", {})
-                    if dbsnp_gene:
-                        result["gene_id"] = str(dbsnp_gene.get("geneid", ""))
+        # A caller-provided client stays open for its other lookups
+        http = nullcontext(client) if client is not None else create_lookup_client()
+        async with http as client:
+            data = await _query_myvariant(client, query)
+
+        hits = data.get("hits")
+        if hits:
+            _apply_hit(result, hits[0])
 
     except Exception:
-        # Silently fail - we'll return partial results from local mapping
+        # Give up after retries - we'll return partial results from local mapping
         pass
+    else:
+        # No hits may be a transient API state, so only found variants are cached
+        if hits:
+            _LOOKUP_CACHE[cache_key] = dict(result)
+            if len(_LOOKUP_CACHE) > LOOKUP_CACHE_SIZE:
+                del _LOOKUP_CACHE[next(iter(_LOOKUP_CACHE))]
 
     return result
 
 
 def normalize_single(gene: str, variant: str, genomic_info: dict | None = None) -> dict:
     """Normalize a single variant and return comprehensive results."""
-    result = normalize_variant(gene, variant)
-
-    # Add additional useful fields
-    result['hgvs_protein'] = to_hgvs_protein(variant)
-    result['position'] = get_protein_position(variant)
-    result['is_allowed_type'] = is_snp_or_small_indel(gene, variant)
+    # Normalized fields plus hgvs_protein, position and is_allowed_type
+    result = normalize_variant_full(gene, variant)
+    gene_symbol = result['gene']
+    normalized = result['variant_normalized']
 
     # Add chromosome from local mapping
-    gene_upper = gene.upper()
-    result['chromosome'] = GENE_CHROMOSOMES.get(gene_upper)
+    extras = {'chromosome': _chromosome_for(gene)}
 
     # Add genomic info if provided (from API lookup)
     if genomic_info:
-        result['chromosome'] = genomic_info.get('chromosome') or result.get('chromosome')
-        result['hgvs_genomic'] = genomic_info.get('hgvs_genomic')
-        result['gene_name'] = genomic_info.get('gene_name')
-        result['gene_id'] = genomic_info.get('gene_id')
-        result['transcript_id'] = genomic_info.get('transcript_id')
-        result['exon'] = genomic_info.get('exon')
-        result['genomic_position'] = genomic_info.get('genomic_position')
-        result['ref_allele'] = genomic_info.get('ref_allele')
-        result['alt_allele'] = genomic_info.get('alt_allele')
+        extras['chromosome'] = genomic_info.get('chromosome') or extras['chromosome']
+        # Fields the lookup did not find stay in the output as None
+        for key in _GENOMIC_FIELDS:
+            extras[key] = genomic_info.get(key)
 
     # Add query formats for common APIs
-    result['query_formats'] = {
-        'myvariant': f"{result['gene']} p.{result['variant_normalized']}" if result['protein_change'] else f"{result['gene']} {result['variant_normalized']}",
-        'vicc': f"{result['gene']} {result['variant_normalized']}",
-        'civic': f"{result['gene']} {result['variant_normalized']}",
+    extras['query_formats'] = {
+        'myvariant': f"{gene_symbol} p.{normalized}" if result['protein_change'] else f"{gene_symbol} {normalized}",
+        'vicc': f"{gene_symbol} {normalized}",
+        'civic': f"{gene_symbol} {normalized}",
     }
 
+    result |= extras
     return result
 
 
-async def normalize_single_with_lookup(gene: str, variant: str) -> dict:
+async def normalize_single_with_lookup(
+    gene: str,
+    variant: str,
+    client: "httpx.AsyncClient | None" = None,
+) -> dict:
     """Normalize a variant with genomic lookup from MyVariant.info."""
-    genomic_info = await lookup_genomic_info(gene, variant)
+    genomic_info = await lookup_genomic_info(gene, variant, client)
     return normalize_single(gene, variant, genomic_info)
 
 
@@ -247,68 +345,83 @@ def format_json(results: list[dict], pretty: bool = True) -> str:
     return json.dumps(results, indent=2 if pretty else None)
 
 
-def format_table(results: list[dict]) -> str:
-    """Format results as a human-readable table."""
-    lines = []
+_TABLE_RULE = "=" * 60
+_SECTION_RULE = "-" * 40
+
+
+def _table_block(result: dict) -> str:
+    """Render one result as a block of table lines."""
+    get = result.get
+    lines = [
+        _TABLE_RULE,
+        f"Gene:             {result['gene']}",
+        f"Original:         {result['variant_original']}",
+        f"Normalized:       {result['variant_normalized']}",
+        f"Type:             {result['variant_type']}",
+        f"Chromosome:       {get('chromosome', 'N/A')}",
+        f"HGVS Protein:     {get('hgvs_protein', 'N/A')}",
+        f"HGVS Genomic:     {get('hgvs_genomic', 'N/A')}",
+        f"Position:         {get('position', 'N/A')}",
+        f"Allowed Type:     {get('is_allowed_type', 'N/A')}",
+    ]
+
+    # Genomic details (if lookup was performed)
+    gene_name = get('gene_name')
+    gene_id = get('gene_id')
+    if gene_name or gene_id:
+        lines += (_SECTION_RULE, "Genomic Details:")
+        if gene_name:
+            lines.append(f"  Gene Name:      {gene_name}")
+        if gene_id:
+            lines.append(f"  Gene ID:        {gene_id}")
+        if transcript_id := get('transcript_id'):
+            lines.append(f"  Transcript:     {transcript_id}")
+        if exon := get('exon'):
+            lines.append(f"  Exon:           {exon}")
+        if genomic_position := get('genomic_position'):
+            lines.append(f"  Genomic Pos:    {genomic_position}")
+        ref_allele = get('ref_allele')
+        alt_allele = get('alt_allele')
+        if ref_allele and alt_allele:
+            lines.append(f"  Alleles:        {ref_allele}>{alt_allele}")
+
+    if pc := get('protein_change'):
+        lines += (
+            _SECTION_RULE,
+            "Protein Change:",
+            f"  Ref AA:         {pc.get('ref_aa', 'N/A')}",
+            f"  Alt AA:         {pc.get('alt_aa', 'N/A')}",
+            f"  Long Form:      {pc.get('long_form', 'N/A')}",
+        )
+
+    if qf := get('query_formats'):
+        lines += (
+            _SECTION_RULE,
+            "Query Formats:",
+            f"  MyVariant:      {qf.get('myvariant', 'N/A')}",
+            f"  VICC:           {qf.get('vicc', 'N/A')}",
+            f"  CIViC:          {qf.get('civic', 'N/A')}",
+        )
 
-    for result in results:
-        lines.append("=" * 60)
-        lines.append(f"Gene:             {result['gene']}")
-        lines.append(f"Original:         {result['variant_original']}")
-        lines.append(f"Normalized:       {result['variant_normalized']}")
-        lines.append(f"Type:             {result['variant_type']}")
-        lines.append(f"Chromosome:       {result.get('chromosome', 'N/A')}")
-        lines.append(f"HGVS Protein:     {result.get('hgvs_protein', 'N/A')}")
-        lines.append(f"HGVS Genomic:     {result.get('hgvs_genomic', 'N/A')}")
-        lines.append(f"Position:         {result.get('position', 'N/A')}")
-        lines.append(f"Allowed Type:     {result.get('is_allowed_type', 'N/A')}")
-
-        # Genomic details (if lookup was performed)
-        if result.get('gene_name') or result.get('gene_id'):
-            lines.append("-" * 40)
-            lines.append("Genomic Details:")
-            if result.get('gene_name'):
-                lines.append(f"  Gene Name:      {result['gene_name']}")
-            if result.get('gene_id'):
-                lines.append(f"  Gene ID:        {result['gene_id']}")
-            if result.get('transcript_id'):
-                lines.append(f"  Transcript:     {result['transcript_id']}")
-            if result.get('exon'):
-                lines.append(f"  Exon:           {result['exon']}")
-            if result.get('genomic_position'):
-                lines.append(f"  Genomic Pos:    {result['genomic_position']}")
-            if result.get('ref_allele') and result.get('alt_allele'):
-                lines.append(f"  Alleles:        {result['ref_allele']}>{result['alt_allele']}")
-
-        if result.get('protein_change'):
-            pc = result['protein_change']
-            lines.append("-" * 40)
-            lines.append("Protein Change:")
-            lines.append(f"  Ref AA:         {pc.get('ref_aa', 'N/A')}")
-            lines.append(f"  Alt AA:         {pc.get('alt_aa', 'N/A')}")
-            lines.append(f"  Long Form:      {pc.get('long_form', 'N/A')}")
-
-        if result.get('query_formats'):
-            qf = result['query_formats']
-            lines.append("-" * 40)
-            lines.append("Query Formats:")
-            lines.append(f"  MyVariant:      {qf.get('myvariant', 'N/A')}")
-            lines.append(f"  VICC:           {qf.get('vicc', 'N/A')}")
-            lines.append(f"  CIViC:          {qf.get('civic', 'N/A')}")
-
-    lines.append("=" * 60)
     return "\n".join(lines)
 
 
-def format_tsv(results: list[dict]) -> str:
-    """Format results as TSV."""
+def _table_lines(results: Iterable[dict]) -> Iterator[str]:
+    """Yield the human-readable table one result block at a time."""
+    for result in results:
+        yield _table_block(result)
+    yield _TABLE_RULE
+
+
+def _tsv_lines(results: Iterable[dict]) -> Iterator[str]:
+    """Yield the TSV header and one line per result."""
     headers = [
         "gene", "chromosome", "variant_original", "variant_normalized", "variant_type",
         "hgvs_protein", "hgvs_genomic", "position", "genomic_position",
         "is_allowed_type", "ref_aa", "alt_aa", "gene_name", "gene_id", "transcript_id", "exon"
     ]
 
-    lines = ["\t".join(headers)]
+    yield "\t".join(headers)
 
     for result in results:
         pc = result.get('protein_change') or {}
@@ -330,59 +443,146 @@ def format_tsv(results: list[dict]) -> str:
             result.get('transcript_id') or '',
             result.get('exon') or '',
         ]
-        lines.append("\t".join(row))
+        yield "\t".join(row)
 
-    return "\n".join(lines)
+
+def _write_lines(lines: Iterable[str], out: TextIO | None) -> None:
+    """Write lines as they are produced rather than joining them first.
+
+    Writes to sys.stdout when out is None.
+    """
+    if out is None:
+        out = sys.stdout
+    for line in lines:
+        out.write(line)
+        out.write("\n")
+
+
+def format_table(results: list[dict]) -> str:
+    """Format results as a human-readable table."""
+    return "\n".join(_table_lines(results))
+
+
+def write_table(results: Iterable[dict], out: TextIO | None = None) -> None:
+    """Write results as a human-readable table, streaming line by line."""
+    _write_lines(_table_lines(results), out)
+
+
+def format_tsv(results: list[dict]) -> str:
+    """Format results as TSV."""
+    return "\n".join(_tsv_lines(results))
+
+
+def write_tsv(results: Iterable[dict], out: TextIO | None = None) -> None:
+    """Write results as TSV, streaming line by line."""
+    _write_lines(_tsv_lines(results), out)
 
 
 def parse_batch_line(line: str) -> tuple[str, str] | None:
-    """Parse a line from batch input (gene,variant or gene\tvariant)."""
+    """Parse a line from batch input (gene,variant or gene\tvariant).
+
+    Separators are tried in priority order: comma, then tab, then any
+    whitespace (for "BRAF V600E" format), splitting at the first occurrence.
+    """
     line = line.strip()
-    if not line or line.startswith('#'):
+    if not line or line[0] == '#':
         return None
 
-    # Try comma separator
-    if ',' in line:
-        parts = line.split(',', 1)
-        if len(parts) == 2:
-            return parts[0].strip(), parts[1].strip()
-
-    # Try tab separator
-    if '\t' in line:
-        parts = line.split('\t', 1)
-        if len(parts) == 2:
-            return parts[0].strip(), parts[1].strip()
+    for sep in (',', '\t'):
+        gene, found, variant = line.partition(sep)
+        if found:
+            return gene.strip(), variant.strip()
 
-    # Try space separator (for "BRAF V600E" format)
     parts = line.split(None, 1)
     if len(parts) == 2:
-        return parts[0].strip(), parts[1].strip()
+        return parts[0], parts[1]
 
     return None
 
 
-def process_batch(input_file: TextIO, lookup: bool = False) -> list[dict]:
-    """Process batch input from a file or stdin."""
+def _error_result(line_num: int, gene: str, variant: str, error: Exception) -> dict:
+    """Build the batch record for a variant that failed to normalize."""
+    return {
+        'line_number': line_num,
+        'gene': gene,
+        'variant_original': variant,
+        'error': str(error)
+    }
+
+
+async def _process_batch_lookup(entries: list[tuple[int, str, str]]) -> list[dict]:
+    """Normalize parsed batch entries with concurrent genomic lookups.
+
+    Each distinct (gene, variant) is looked up once, with at most
+    LOOKUP_CONCURRENCY requests in flight and a progress bar on interactive
+    terminals; results keep the order of the input lines.
+    """
+    import asyncio
+
+    from rich.console import Console
+    from rich.progress import Progress
+
+    semaphore = asyncio.Semaphore(LOOKUP_CONCURRENCY)
+
+    async with create_lookup_client() as client:
+
+        async def lookup(gene: str, variant: str) -> dict[str, Any]:
+            async with semaphore:
+                return await lookup_genomic_info(gene, variant, client)
+
+        lookups: dict[tuple[str, str], asyncio.Task] = {}
+        for _, gene, variant in entries:
+            key = (gene.upper(), variant)
+            if key not in lookups:
+                lookups[key] = asyncio.create_task(lookup(gene, variant))
+
+        # Progress goes to stderr, and only on a terminal, so output stays clean
+        with Progress(
+            console=Console(stderr=True),
+            transient=True,
+            disable=not sys.stderr.isatty(),
+        ) as progress:
+            progress_task = progress.add_task("Looking up variants", total=len(lookups))
+            for done in asyncio.as_completed(lookups.values()):
+                with suppress(Exception):
+                    await done
+                progress.advance(progress_task)
+
     results = []
+    for line_num, gene, variant in entries:
+        try:
+            genomic_info = lookups[gene.upper(), variant].result()
+            result = normalize_single(gene, variant, genomic_info)
+            result['line_number'] = line_num
+            results.append(result)
+        except Exception as e:
+            results.append(_error_result(line_num, gene, variant, e))
+
+    return results
 
+
+def process_batch(input_file: TextIO, lookup: bool = False) -> list[dict]:
+    """Process batch input from a file or stdin."""
+    entries = []
     for line_num, line in enumerate(input_file, 1):
         parsed = parse_batch_line(line)
         if parsed:
-            gene, variant = parsed
-            try:
-                if lookup:
-                    result = asyncio.run(normalize_single_with_lookup(gene, variant))
-                else:
-                    result = normalize_single(gene, variant)
-                result['line_number'] = line_num
-                results.append(result)
-            except Exception as e:
-                results.append({
-                    'line_number': line_num,
-                    'gene': gene,
-                    'variant_original': variant,
-                    'error': str(e)
-                })
+            entries.append((line_num, *parsed))
+
+    if lookup:
+        import asyncio
+
+        # One event loop and one connection pool for the whole batch
+        return asyncio.run(_process_batch_lookup(entries))
+
+    results = []
+    for line_num, gene, variant in entries:
+        try:
+            result = normalize_single(gene, variant)
+            result['line_number'] = line_num
+            results.append(result)
+        except Exception as e:
+            results.append(_error_result(line_num, gene, variant, e))
 
     return results
 
@@ -460,6 +660,8 @@ Batch file format (one variant per line):
         results = process_batch(sys.stdin, lookup=args.lookup)
     elif args.gene and args.variant:
         if args.lookup:
+            import asyncio
+
             results = [asyncio.run(normalize_single_with_lookup(args.gene, args.variant))]
         else:
             results = [normalize_single(args.gene, args.variant)]
@@ -482,9 +684,9 @@ Batch file format (one variant per line):
     if args.format == 'json':
         print(format_json(results, pretty=not args.compact))
     elif args.format == 'table':
-        print(format_table(results))
+        write_table(results)
     elif args.format == 'tsv':
-        print(format_tsv(results))
+        write_tsv(results)
 
 
 if __name__ == '__main__':
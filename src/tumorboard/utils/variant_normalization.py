@@ -211,6 +211,35 @@ def normalize_variant(gene: str, variant: str) -> Dict[str, any]:
     return VariantNormalizer.normalize_variant(gene, variant)
 
 
+def normalize_variant_full(gene: str, variant: str) -> Dict[str, any]:
+    """Normalize a variant and add HGVS, position and allowed-type fields.
+
+    Equivalent to combining normalize_variant(), to_hgvs_protein(),
+    get_protein_position() and is_snp_or_small_indel(), but parses the
+    variant once instead of once per helper.
+
+    Args:
+        gene: Gene symbol
+        variant: Variant string
+
+    Returns:
+        Dictionary from normalize_variant() plus:
+        - hgvs_protein: HGVS protein notation (p.V600E), or None
+        - position: Protein position, or None
+        - is_allowed_type: True if the variant is a SNP or small indel
+
+    Examples:
+        >>> normalize_variant_full('BRAF', 'Val600Glu')
+        {'gene': 'BRAF', 'variant_normalized': 'V600E', ..., 'hgvs_protein': 'p.V600E', 'position': 600, 'is_allowed_type': True}
+    """
+    result = VariantNormalizer.normalize_variant(gene, variant)
+    protein_change = result['protein_change']
+    result['hgvs_protein'] = protein_change['hgvs_protein'] if protein_change else None
+    result['position'] = protein_change['position'] if protein_change else None
+    result['is_allowed_type'] = result['variant_type'] in VariantNormalizer.ALLOWED_VARIANT_TYPES
+    return result
+
+
 def is_missense_variant(gene: str, variant: str) -> bool:
     """Check if a variant is a missense mutation.
 
@@ -0,0 +1,147 @@
+"""Shared fixtures for integration tests.
+
+API clients are opened once per session so tests reuse their connection
+pools instead of reconnecting in every test. The clients are bound to the
+session event loop, so tests that use them must run in it too
+(``pytest.mark.asyncio(loop_scope="session")``).
+
+``cached_myvariant``, ``cached_vicc`` and ``cached_fda_approvals`` memoize
+the lookups that several tests repeat (BRAF V600E, BRCA1 C61G, MLH1 V716M),
+so each distinct query hits the network once per session.
+"""
+
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def myvariant_client():
+    """MyVariant.info client shared across the test session."""
+    from tumorboard.api.myvariant import MyVariantClient
+
+    async with MyVariantClient() as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def vicc_client():
+    """VICC MetaKB client shared across the test session."""
+    from tumorboard.api.vicc import VICCClient
+
+    async with VICCClient() as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def fda_client():
+    """openFDA client shared across the test session."""
+    from tumorboard.api.fda import FDAClient
+
+    async with FDAClient() as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def civic_client():
+    """CIViC GraphQL client shared across the test session."""
+    from tumorboard.api.civic import CIViCClient
+
+    async with CIViCClient() as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def cgi_client():
+    """CGI biomarkers client shared across the test session.
+
+    The client parses its biomarker TSV on first use and keeps the rows, so
+    sharing it means the file is read once per session. Async tests call
+    ``fetch_biomarkers_async``.
+    """
+    from tumorboard.api.cgi import CGIClient
+
+    async with CGIClient() as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def cached_myvariant(myvariant_client):
+    """Fetch MyVariant evidence once per (gene, variant) for the session.
+
+    Tests attach other sources to the returned ``Evidence``, so each call
+    gets its own deep copy of the cached object.
+    """
+    cache = {}
+
+    async def fetch(gene, variant):
+        key = (gene, variant)
+        if key not in cache:
+            cache[key] = await myvariant_client.fetch_evidence(gene, variant)
+        return cache[key].model_copy(deep=True)
+
+    return fetch
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def cached_vicc(vicc_client):
+    """Fetch VICC associations once per query for the session."""
+    cache = {}
+
+    async def fetch(gene, variant, tumor_type=None, max_results=50):
+        key = (gene, variant, tumor_type, max_results)
+        if key not in cache:
+            cache[key] = await vicc_client.fetch_associations(
+                gene, variant, tumor_type=tumor_type, max_results=max_results
+            )
+        return list(cache[key])
+
+    return fetch
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def cached_fda_approvals(fda_client):
+    """Fetch openFDA approval records once per (gene, variant) for the session.
+
+    ``fetch_drug_approvals`` returns ``[]`` on any error, so empty results are
+    not memoized: a lookup that failed is retried on its next use.
+    """
+    cache = {}
+
+    async def fetch(gene, variant):
+        key = (gene, variant)
+        if key in cache:
+            return list(cache[key])
+        approvals = await fda_client.fetch_drug_approvals(gene, variant)
+        if approvals:
+            cache[key] = approvals
+        return list(approvals)
+
+    return fetch
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def civic_braf_v600e_melanoma_assertions(civic_client):
+    """CIViC assertions for BRAF V600E in melanoma, fetched once."""
+    return await civic_client.fetch_assertions(
+        "BRAF", "V600E", tumor_type="melanoma", max_results=20
+    )
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def braf_v600e_vicc_evidence(cached_vicc):
+    """BRAF V600E ``VICCEvidence`` across all tumor types, built once."""
+    from tumorboard.models.evidence.builders import build_vicc_evidence
+
+    associations = await cached_vicc("BRAF", "V600E", max_results=30)
+    return build_vicc_evidence(associations)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def braf_v600e_evidence(cached_myvariant, braf_v600e_vicc_evidence):
+    """BRAF V600E ``Evidence`` with its VICC evidence attached.
+
+    Assembled per test from the session caches, so no network round trip is
+    repeated and tests may modify the object freely.
+    """
+    evidence = await cached_myvariant("BRAF", "V600E")
+    evidence.vicc = list(braf_v600e_vicc_evidence)
+    return evidence
@@ -68,6 +68,20 @@ class TestFDAApprovalParsing:
         assert approval.parse_indication_for_tumor("Non-Small Cell Lung Cancer")['tumor_match'] is True
         assert approval.parse_indication_for_tumor("lung")['tumor_match'] is True
 
+    def test_cached_parse_returns_independent_results(self):
+        """Verify repeated parses of a shared label return fresh, equal dicts."""
+        indication = ("indicated for the treatment of adult patients with metastatic colorectal cancer (CRC) "
+                      "with a BRAF V600E mutation, after prior therapy.")
+        first = FDAApproval(drug_name="encorafenib", indication=indication)
+        second = FDAApproval(drug_name="encorafenib", indication=indication)
+
+        result = first.parse_indication_for_tumor("Colorectal Cancer")
+        result['line_of_therapy'] = 'mutated'
+
+        again = second.parse_indication_for_tumor("Colorectal Cancer")
+        assert again['line_of_therapy'] == 'later-line'
+        assert again is not result
+
 
 class TestVariantMatchesApprovalClass:
     """Test the new variant-specific approval matching logic."""
@@ -1,6 +1,8 @@
 """Tests for API client."""
 
+import httpx
 import pytest
+from tenacity import wait_none
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from tumorboard.api.myvariant import MyVariantAPIError, MyVariantClient
@@ -20,6 +22,18 @@ class TestMyVariantClient:
         # Client should be closed after exit
         assert client._client is None
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("http2_available", [True, False])
+    async def test_context_manager_uses_timeout(self, monkeypatch, http2_available):
+        """Test the pooled HTTP client uses the configured timeout and HTTP/2 setting."""
+        monkeypatch.setattr("tumorboard.api.http_client.HTTP2_AVAILABLE", http2_available)
+
+        with patch("httpx.AsyncClient", wraps=httpx.AsyncClient) as mock_client_cls:
+            async with MyVariantClient(timeout=7.5) as client:
+                assert client._client.timeout.read == 7.5
+
+        assert mock_client_cls.call_args.kwargs["http2"] is http2_available
+
     @pytest.mark.asyncio
     async def test_fetch_evidence_no_results(self):
         """Test fetching evidence with no results."""
@@ -308,6 +322,24 @@ class TestFDAClient:
 
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_query_retries_rate_limit(self):
+        """Test that 429 responses are retried instead of failing the query."""
+        statuses = iter([429, 200])
+
+        def handler(request):
+            status = next(statuses)
+            return httpx.Response(status, json={"results": [{"id": "1"}]} if status == 200 else {})
+
+        client = FDAClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        with patch.object(FDAClient._query_drugsfda.retry, "wait", wait_none()):
+            result = await client._query_drugsfda("BRAF AND V600E")
+
+        assert result == {"results": [{"id": "1"}]}
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_fetch_drug_approvals_filters_by_gene(self):
         """Test that fetch_drug_approvals filters results by gene mention."""
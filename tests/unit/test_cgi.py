@@ -363,6 +363,52 @@ class TestCGIClient:
         assert len(biomarkers) == 1
         assert biomarkers[0].drug == "Binimetinib"
 
+    @patch("tumorboard.api.cgi.CGIClient._load_biomarkers_async")
+    async def test_fetch_biomarkers_async_loads_once(self, mock_load):
+        """Test async fetch loads the TSV once and reuses the rows."""
+        mock_load.return_value = [
+            {
+                "Gene": "EGFR",
+                "Alteration": "EGFR:G719.",
+                "Drug": "Afatinib",
+                "Drug status": "Approved",
+                "Association": "Responsive",
+                "Evidence level": "FDA guidelines",
+                "Source": "FDA",
+                "Primary Tumor type": "NSCLC",
+                "Primary Tumor type full name": "Non-small cell lung",
+            },
+        ]
+
+        async with CGIClient() as client:
+            first = await client.fetch_biomarkers_async("EGFR", "G719S")
+            second = await client.fetch_biomarkers_async("EGFR", "G719A")
+
+        assert [b.drug for b in first] == ["Afatinib"]
+        assert [b.drug for b in second] == ["Afatinib"]
+        mock_load.assert_awaited_once()
+
+    async def test_fetch_biomarkers_async_concurrent_first_load(self):
+        """Test concurrent first calls share a single TSV load."""
+        import asyncio
+
+        client = CGIClient()
+        loads = 0
+
+        async def slow_load():
+            nonlocal loads
+            loads += 1
+            await asyncio.sleep(0.01)
+            return []
+
+        with patch.object(client, "_load_biomarkers_async", side_effect=slow_load):
+            results = await asyncio.gather(
+                *(client.fetch_biomarkers_async("EGFR", "G719S") for _ in range(5))
+            )
+
+        assert results == [[]] * 5
+        assert loads == 1
+
 
 class TestCGIClientIntegration:
     """Integration tests for CGI client (requires network)."""
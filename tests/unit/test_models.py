@@ -120,6 +120,14 @@ class TestEvidence:
         assert evidence.hgvs_protein == "NP_004324.2:p.Val600Glu"
         assert evidence.hgvs_transcript == "NM_004333.4:c.1799T>A"
 
+    def test_tumor_matches(self):
+        """Test tumor/disease matching by substring and by tumor type mappings."""
+        assert Evidence._tumor_matches("Melanoma", "Skin Melanoma")
+        assert Evidence._tumor_matches("NSCLC", "Non-small cell lung carcinoma")
+        assert not Evidence._tumor_matches("melanoma", "Colorectal cancer")
+        assert not Evidence._tumor_matches(None, "Melanoma")
+        assert not Evidence._tumor_matches("melanoma", None)
+
 
 class TestActionabilityAssessment:
     """Tests for ActionabilityAssessment model."""
@@ -687,3 +695,238 @@ class TestDrugAggregation:
 
         summary = evidence.format_drug_aggregation_summary()
         assert summary == ""  # No summary for empty evidence
+
+
+class TestFDAApproval:
+    """Tests for FDAApproval indication helpers."""
+
+    def test_indication_lower_follows_copies(self):
+        """Test the lowered indication reflects the label of copied models."""
+        from tumorboard.models.evidence.fda import FDAApproval
+
+        approval = FDAApproval(brand_name="Drug", indication="Melanoma X")
+        assert approval.indication_lower == "melanoma x"
+
+        updated = approval.model_copy(update={"indication": "Lung Y"})
+        assert updated.indication_lower == "lung y"
+        assert updated.parse_indication_for_tumor("Melanoma")["tumor_match"] is False
+        assert FDAApproval().indication_lower == ""
+
+
+class TestPubMedEvidence:
+    """Tests for PubMedEvidence formatting."""
+
+    def test_formatting_follows_copies(self):
+        """Test citation and impact strings reflect the fields of copied models."""
+        from tumorboard.models.evidence.pubmed import PubMedEvidence
+
+        article = PubMedEvidence(
+            pmid="1",
+            title="BRAF inhibitor resistance",
+            authors=["Smith J", "Doe A"],
+            journal="Nature",
+            year="2020",
+            url="https://pubmed.ncbi.nlm.nih.gov/1/",
+            citation_count=10,
+        )
+        assert article.format_citation() == "Smith J et al. (2020). Nature. PMID: 1"
+        assert article.get_impact_indicator() == "10 citations"
+
+        updated = article.model_copy(update={"pmid": "2", "citation_count": 75})
+        assert updated.format_citation() == "Smith J et al. (2020). Nature. PMID: 2"
+        assert updated.get_impact_indicator() == "75 citations"
+
+
+class TestLiteratureKnowledge:
+    """Tests for LiteratureKnowledge drug accessors."""
+
+    def test_drug_accessors(self):
+        """Test resistance and sensitivity drug names are exposed in order."""
+        from tumorboard.models.evidence.literature_knowledge import (
+            DrugResistance,
+            DrugSensitivity,
+            LiteratureKnowledge,
+        )
+
+        knowledge = LiteratureKnowledge(
+            resistant_to=[
+                DrugResistance(drug="Cetuximab", is_predictive=True),
+                DrugResistance(drug="Chemotherapy", is_predictive=False),
+            ],
+            sensitive_to=[DrugSensitivity(drug="Sotorasib")],
+        )
+
+        assert knowledge.get_resistance_drugs() == ["Cetuximab", "Chemotherapy"]
+        assert knowledge.get_resistance_drugs(predictive_only=True) == ["Cetuximab"]
+        assert knowledge.get_sensitivity_drugs() == ["Sotorasib"]
+        assert knowledge.has_therapeutic_options() is True
+        assert LiteratureKnowledge().has_therapeutic_options() is False
+
+    def test_drug_accessors_follow_copies(self):
+        """Test drug names reflect the fields of copied and constructed models."""
+        from tumorboard.models.evidence.literature_knowledge import (
+            DrugSensitivity,
+            LiteratureKnowledge,
+        )
+
+        knowledge = LiteratureKnowledge(sensitive_to=[DrugSensitivity(drug="Binimetinib")])
+        updated = knowledge.model_copy(update={"sensitive_to": [DrugSensitivity(drug="Sotorasib")]})
+        constructed = LiteratureKnowledge.model_construct(
+            sensitive_to=[DrugSensitivity(drug="Adagrasib")]
+        )
+
+        assert knowledge.get_sensitivity_drugs() == ["Binimetinib"]
+        assert updated.get_sensitivity_drugs() == ["Sotorasib"]
+        assert constructed.get_sensitivity_drugs() == ["Adagrasib"]
+
+
+class TestGeneContext:
+    """Tests for curated gene context lookup."""
+
+    def test_role_priority(self):
+        """Test YAML classes win over hardcoded lists and pathway TSGs over generic TSGs."""
+        from tumorboard.models.gene_context import GeneRole, get_gene_context
+
+        mlh1 = get_gene_context("MLH1")
+        assert mlh1.role == GeneRole.DDR
+        assert mlh1.source == "gene_classes.yaml"
+        assert mlh1.therapeutic_summary.startswith("MMR gene")
+
+        pten = get_gene_context("pten")
+        assert pten.gene == "PTEN"
+        assert pten.role == GeneRole.TSG_PATHWAY_ACTIONABLE
+
+        tp53 = get_gene_context("TP53")
+        assert tp53.role == GeneRole.TSG
+        assert tp53.has_therapeutic_evidence is False
+
+        unknown = get_gene_context("NOTAGENE")
+        assert unknown.is_cancer_gene is False
+        assert unknown.role == GeneRole.UNKNOWN
+
+    def test_gene_class_items(self):
+        """Test GeneClassConfig exposes every classified gene with its class."""
+        from tumorboard.models.gene_context import load_gene_classes
+
+        config = load_gene_classes()
+        items = dict(config.gene_class_items())
+        assert items["BRCA1"] == "ddr"
+        assert items["MLH1"] == "mmr"
+        assert all(config.get_gene_class(gene) == name for gene, name in items.items())
+
+    def test_contexts_are_cached(self):
+        """Test repeated lookups share one immutable instance regardless of case."""
+        from tumorboard.models.gene_context import get_gene_context
+
+        assert get_gene_context("brca1") is get_gene_context("BRCA1")
+        assert get_gene_context("notagene") is get_gene_context("NOTAGENE")
+
+    def test_tumor_keyword_matching(self):
+        """Test high-prevalence and FDA tumor keywords match in either direction."""
+        from tumorboard.models.gene_context import (
+            is_high_prevalence_tumor,
+            is_oncogene_class_fda_tumor,
+        )
+
+        assert is_high_prevalence_tumor("VHL", "Clear Cell Renal Cell Carcinoma")
+        assert is_high_prevalence_tumor("tsc1", "Clear Cell Renal Cell Carcinoma")
+        assert not is_high_prevalence_tumor("PTEN", "Clear Cell Renal Cell Carcinoma")
+        assert not is_high_prevalence_tumor("TP53", "Renal")
+        assert is_oncogene_class_fda_tumor("BRAF", "G469A", "Non-Small Cell Lung Cancer")
+        assert not is_oncogene_class_fda_tumor("BRAF", "G469A", "Melanoma")
+        assert is_oncogene_class_fda_tumor("BRAF", "p.V600E", "melanoma")
+
+    def test_batch_lookup(self):
+        """Test batch lookup matches per-gene lookup in input order."""
+        from tumorboard.models.gene_context import get_gene_context, get_gene_contexts
+
+        genes = ["BRAF", "tp53", "NOTAGENE", "BRAF"]
+        assert get_gene_contexts(genes) == [get_gene_context(g) for g in genes]
+        assert get_gene_contexts([]) == []
+
+    def test_lof_notation_priority(self):
+        """Test LOF notation checks apply in priority order, not string position."""
+        from tumorboard.models.gene_context import is_likely_lof
+
+        assert is_likely_lof("W288fs*") == (True, "nonsense (stop codon)")
+        assert is_likely_lof("p.R175fs") == (True, "frameshift")
+        assert is_likely_lof("c.123+1G>A") == (True, "splice site")
+        assert is_likely_lof("K27del") == (False, "")
+        assert is_likely_lof("V600E") == (False, "")
+
+    def test_genes_in_several_lists(self):
+        """Test genes listed in several curated sources resolve to the highest-priority role."""
+        from tumorboard.models.gene_context import GeneRole, get_gene_context
+
+        # Splicing class has no special handling; SF3B1 is also a curated oncogene
+        assert get_gene_context("SF3B1").role == GeneRole.ONCOGENE
+        # VHL is both a pathway-actionable TSG and a generic TSG
+        assert get_gene_context("VHL").source == "pathway_actionable_tsg"
+        # BRCA2 is in both the YAML DDR class and the hardcoded DDR list
+        assert get_gene_context("BRCA2").source == "gene_classes.yaml"
+
+    def test_context_is_immutable(self):
+        """Test shared GeneContext instances are slotted and frozen."""
+        import dataclasses
+
+        from tumorboard.models.gene_context import GeneRole, get_gene_context
+
+        context = get_gene_context("BRAF")
+        assert not hasattr(context, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            context.role = GeneRole.TSG
+        assert dataclasses.replace(context, gene="X").role == GeneRole.ONCOGENE
+
+
+class TestEvidenceBuilders:
+    """Tests for converting API client results into evidence models."""
+
+    def test_populate_all_attaches_non_empty_sources(self):
+        """Test populate_all converts each source and skips empty ones."""
+        from tumorboard.api.cgi import CGIBiomarker
+        from tumorboard.api.vicc import VICCAssociation
+        from tumorboard.models.evidence.builders import populate_all
+
+        evidence = Evidence(variant_id="BRAF:V600E", gene="BRAF", variant="V600E")
+        vicc = [
+            VICCAssociation(
+                description="Sensitive to vemurafenib",
+                gene="BRAF",
+                variant="V600E",
+                disease="Melanoma",
+                drugs=["Vemurafenib"],
+                evidence_level="A",
+                response_type="Sensitivity/Response",
+                source="civic",
+            )
+        ]
+        cgi = [
+            CGIBiomarker(
+                gene="BRAF",
+                alteration="BRAF:V600E",
+                drug="Vemurafenib",
+                drug_status="Approved",
+                association="Responsive",
+                evidence_level="FDA guidelines",
+                source="FDA",
+                tumor_type="CM",
+                tumor_type_full="Cutaneous melanoma",
+            )
+        ]
+
+        result = populate_all(evidence, fda=[None], cgi=cgi, vicc=vicc, civic=[])
+
+        assert result is evidence
+        assert evidence.fda_approvals == []
+        assert evidence.cgi_biomarkers[0].fda_approved
+        assert evidence.vicc[0].is_sensitivity
+        assert not evidence.vicc[0].is_resistance
+        assert evidence.civic_assertions == []
+
+    def test_build_fda_approvals_skips_unparsed(self):
+        """Test records the FDA parser rejected are dropped."""
+        from tumorboard.models.evidence.builders import build_fda_approvals
+
+        approvals = build_fda_approvals([None, {"drug_name": "Vemurafenib", "gene": "BRAF"}])
+
+        assert [approval.drug_name for approval in approvals] == ["Vemurafenib"]
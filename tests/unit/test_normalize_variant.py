@@ -0,0 +1,195 @@
+"""Tests for the normalize_variant command-line tool."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from tenacity import wait_none
+
+from tumorboard.tools import normalize_variant
+from tumorboard.tools.normalize_variant import (
+    _process_batch_lookup,
+    _query_myvariant,
+    lookup_genomic_info,
+)
+
+
+def _no_wait(*args, **kwargs):
+    """Stand-in for tenacity wait strategies so retries happen immediately."""
+    return wait_none()
+
+
+class TestQueryMyVariant:
+    """Tests for MyVariant.info queries and their retry policy."""
+
+    @pytest.mark.asyncio
+    async def test_query_retries_rate_limit(self):
+        """Test that a 429 response is retried and the next 200 is returned."""
+        statuses = iter([429, 200])
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            status = next(statuses)
+            return httpx.Response(status, json={"hits": [{"_id": "1"}]} if status == 200 else {})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with patch("tenacity.wait_exponential", _no_wait), patch("tenacity.wait_random", _no_wait):
+                result = await _query_myvariant(client, "BRAF p.V600E")
+
+        assert result == {"hits": [{"_id": "1"}]}
+        assert len(requests) == 2
+        assert requests[0].url.params["q"] == "BRAF p.V600E"
+
+    @pytest.mark.asyncio
+    async def test_query_does_not_retry_not_found(self):
+        """Test that a 404 response fails on the first attempt."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(404, json={})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with patch("tenacity.wait_exponential", _no_wait), patch("tenacity.wait_random", _no_wait):
+                with pytest.raises(httpx.HTTPStatusError):
+                    await _query_myvariant(client, "BRAF p.V600E")
+
+        assert len(requests) == 1
+
+
+class TestLookupCache:
+    """Tests for the process-wide genomic lookup cache."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self, monkeypatch):
+        """Give each test its own empty lookup cache."""
+        monkeypatch.setattr(normalize_variant, "_LOOKUP_CACHE", {})
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_is_not_cached(self):
+        """Test that a failed lookup is retried and a later success is cached."""
+        hit = {"_id": "chr7:g.140453136A>T"}
+        statuses = iter([404, 200])
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            status = next(statuses)
+            return httpx.Response(status, json={"hits": [hit]} if status == 200 else {})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            failed = await lookup_genomic_info("braf", "V600E", client)
+            assert failed["hgvs_genomic"] is None
+            assert failed["chromosome"] == "7"
+            assert normalize_variant._LOOKUP_CACHE == {}
+
+            found = await lookup_genomic_info("braf", "V600E", client)
+            assert found["hgvs_genomic"] == "chr7:g.140453136A>T"
+            assert found["genomic_position"] == 140453136
+
+            # Served from the cache under the upper-cased gene, without a request
+            cached = await lookup_genomic_info("BRAF", "V600E", client)
+
+        assert cached == found
+        assert len(requests) == 2
+        assert list(normalize_variant._LOOKUP_CACHE) == [("BRAF", "V600E")]
+
+    @pytest.mark.asyncio
+    async def test_cached_lookup_returns_copies(self):
+        """Test that mutating a lookup result does not change the cached entry."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"hits": [{"_id": "chr7:g.140453136A>T"}]})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            first = await lookup_genomic_info("BRAF", "V600E", client)
+            first["hgvs_genomic"] = "changed"
+
+            second = await lookup_genomic_info("BRAF", "V600E", client)
+            assert second["hgvs_genomic"] == "chr7:g.140453136A>T"
+            second["chromosome"] = "changed"
+
+            third = await lookup_genomic_info("BRAF", "V600E", client)
+
+        assert third["hgvs_genomic"] == "chr7:g.140453136A>T"
+        assert third["chromosome"] == "7"
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_lookup_is_not_cached(self):
+        """Test that a response without hits is queried again on the next call."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"hits": []})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await lookup_genomic_info("BRAF", "V600E", client)
+            result = await lookup_genomic_info("BRAF", "V600E", client)
+
+        assert result["hgvs_genomic"] is None
+        assert normalize_variant._LOOKUP_CACHE == {}
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self, monkeypatch):
+        """Test that the cache stays bounded and keeps recently used entries."""
+        monkeypatch.setattr(normalize_variant, "LOOKUP_CACHE_SIZE", 2)
+
+        def handler(request):
+            return httpx.Response(200, json={"hits": [{"_id": "chr7:g.140453136A>T"}]})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await lookup_genomic_info("BRAF", "V600E", client)
+            await lookup_genomic_info("EGFR", "L858R", client)
+            await lookup_genomic_info("BRAF", "V600E", client)
+            await lookup_genomic_info("KRAS", "G12C", client)
+
+        assert list(normalize_variant._LOOKUP_CACHE) == [("BRAF", "V600E"), ("KRAS", "G12C")]
+
+
+class TestProcessBatchLookup:
+    """Tests for batch normalization with genomic lookups."""
+
+    @pytest.mark.asyncio
+    async def test_batch_lookup_dedupes_and_keeps_order(self):
+        """Test one lookup per distinct variant, fanned out to every line in order."""
+
+        async def fake_lookup(gene, variant, client=None):
+            if gene.upper() == "KRAS":
+                raise RuntimeError("lookup failed")
+            return {"chromosome": "7", "hgvs_genomic": f"{gene.upper()}:{variant}"}
+
+        entries = [
+            (1, "BRAF", "V600E"),
+            (2, "egfr", "L858R"),
+            (4, "braf", "V600E"),
+            (5, "KRAS", "G12C"),
+            (7, "EGFR", "L858R"),
+            (8, "kras", "G12C"),
+        ]
+
+        with patch.object(
+            normalize_variant, "lookup_genomic_info", AsyncMock(side_effect=fake_lookup)
+        ) as mock_lookup:
+            results = await _process_batch_lookup(entries)
+
+        looked_up = sorted((call.args[0].upper(), call.args[1]) for call in mock_lookup.call_args_list)
+        assert looked_up == [("BRAF", "V600E"), ("EGFR", "L858R"), ("KRAS", "G12C")]
+
+        assert [r["line_number"] for r in results] == [1, 2, 4, 5, 7, 8]
+        assert [r["variant_original"] for r in results] == [v for _, _, v in entries]
+
+        # Repeated lines share the single lookup's result
+        assert results[0]["hgvs_genomic"] == results[2]["hgvs_genomic"] == "BRAF:V600E"
+        assert results[1]["hgvs_genomic"] == results[4]["hgvs_genomic"] == "EGFR:L858R"
+
+        # A failed lookup becomes an error result on each of its lines
+        for result, gene in ((results[3], "KRAS"), (results[5], "kras")):
+            assert result["gene"] == gene
+            assert result["error"] == "lookup failed"
+            assert "hgvs_genomic" not in result
@@ -4,6 +4,7 @@ import pytest
 from tumorboard.utils.variant_normalization import (
     VariantNormalizer,
     normalize_variant,
+    normalize_variant_full,
     is_missense_variant,
     is_snp_or_small_indel,
     get_protein_position,
@@ -207,6 +208,18 @@ class TestConvenienceFunctions:
         assert to_hgvs_protein("fusion") is None
         assert to_hgvs_protein("amplification") is None
 
+    def test_normalize_variant_full_matches_helpers(self):
+        """Test normalize_variant_full agrees with the individual helpers."""
+        for gene, variant in [
+            ("BRAF", "V600E"), ("BRAF", "p.Val600Glu"), ("TP53", "R248*"),
+            ("EGFR", "L747_P753delinsS"), ("ALK", "fusion"), ("KRAS", "Xaa12Yaa"),
+        ]:
+            result = normalize_variant_full(gene, variant)
+            assert {k: result[k] for k in normalize_variant(gene, variant)} == normalize_variant(gene, variant)
+            assert result['hgvs_protein'] == to_hgvs_protein(variant)
+            assert result['position'] == get_protein_position(variant)
+            assert result['is_allowed_type'] == is_snp_or_small_indel(gene, variant)
+
 
 class TestRealWorldVariants:
     """Tests with real-world variant examples from the gold standard."""